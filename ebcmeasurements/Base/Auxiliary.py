@@ -1,4 +1,9 @@
+import copy
 import json
+import os
+
+# Cache for 'load_json_cached', keyed by (path, modification time, size)
+_load_json_cache: dict[tuple[str, float, int], list | dict] = {}
 
 
 def load_json(file_name: str) -> list | dict:
@@ -8,6 +13,25 @@ def load_json(file_name: str) -> list | dict:
     return content
 
 
+def load_json_cached(file_name: str) -> list | dict:
+    """
+    Read a json file, skipping the parsing if the file is unchanged since the last load
+
+    The parsed content is cached keyed by path, modification time and size; a changed file invalidates its
+    cache entry automatically. The returned content is a deep copy, so callers can mutate it safely.
+    """
+    stat = os.stat(file_name)
+    key = (file_name, stat.st_mtime, stat.st_size)
+    content = _load_json_cache.get(key)
+    if content is None:
+        # Drop stale entries of the same file before caching the fresh content
+        for stale_key in [k for k in _load_json_cache if k[0] == file_name]:
+            del _load_json_cache[stale_key]
+        content = load_json(file_name)
+        _load_json_cache[key] = content
+    return copy.deepcopy(content)
+
+
 def dump_json(content: list | dict, file_name: str):
     """Dump a json file"""
     with open(file_name, 'w') as f:
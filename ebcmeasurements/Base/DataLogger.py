@@ -4,13 +4,41 @@ Base module: DataLogger, incl. ABC of DataSource and DataOutput
 
 from ebcmeasurements.Base import DataSource, DataOutput, DataSourceOutput
 from abc import ABC, abstractmethod
+import asyncio
+import os
+import queue
+import selectors
+import sys
+import threading
 import time
 import logging
-# Load logging configuration from file
 logger = logging.getLogger(__name__)
 
+# Module-level one-slot cache for the second-resolution timestamp string, shared by all logger instances, since all
+# samples within the same wall second need the identical string and time.localtime runs a lock-guarded conversion
+_timestamp_cache: tuple[int, str] = (-1, '')
+
 
 class DataLoggerBase(ABC):
+    # Slots instead of a per-instance __dict__: smaller instances and faster attribute access in the hot loop
+    __slots__ = (
+        '_data_sources_mapping',
+        '_data_outputs_mapping',
+        '_data_sources',
+        '_data_outputs',
+        '_data_type_conversion_mapping',
+        '_data_rename_mapping',
+        '_all_duplicates',
+        '_all_variable_names_dict',
+        '_log_data_plans',
+        '_log_data_plan_groups',
+        '_read_data_callables',
+        '_read_all_sources',
+        '_writer_queues',
+        '_writer_threads',
+        'log_count',
+    )
+
     # Class attribute: supported types by data type conversions
     _types_of_data_type_conversion = ('str', 'int', 'float', 'bool', 'bytes')
 
@@ -112,6 +140,11 @@ class DataLoggerBase(ABC):
             for k, do in data_outputs_mapping.items()
         }
 
+        # Freeze the unwrapped instances as tuples: iteration is slightly faster than over dict values and the
+        # tuples signal that the set of sources and outputs is fixed after initialization
+        self._data_sources = tuple(self._data_sources_mapping.values())
+        self._data_outputs = tuple(self._data_outputs_mapping.values())
+
         # Data type conversion mapping of data sources and outputs
         if data_type_conversion_mapping is not None:
             # Check data type conversion mapping of data sources and outputs
@@ -177,18 +210,92 @@ class DataLoggerBase(ABC):
                 # Without key of log time, only all variable names
                 do.all_variable_names = all_data_sources_all_variable_names
 
+        # Enable the numeric fast path of csv outputs if every data source declares numeric-only values and no type
+        # conversion (e.g. to str or bytes) is configured
+        numeric_only_sources = \
+            self._data_type_conversion_mapping is None and all(ds.numeric_only for ds in self._data_sources)
+
         # Additional methods for DataOutput that must be initialed
         for do in self._data_outputs_mapping.values():
             # Csv output
             if isinstance(do, DataOutput.DataOutputCsv):
                 # Write csv header line
                 do.write_header_line()
+                do.numeric_only = numeric_only_sources
+            elif isinstance(do, DataOutput.DataOutputCsvRaw):
+                # Write csv header line
+                do.write_header_line()
             else:
                 pass
 
+        # Pre-resolve per-output logging plans, so the hot loop does not re-evaluate the rename mapping, the type
+        # conversion mapping and the log_time_required branch for each sample
+        self._log_data_plans = self._init_log_data_plans()
+        self._log_data_plan_groups = self._group_log_data_plans()
+
+        # Pre-bind the read_data methods of all data sources once, so the polling loop avoids repeated attribute
+        # lookups on the mapping and its instances
+        self._read_data_callables = tuple(
+            (ds_name, ds.read_data) for ds_name, ds in self._data_sources_mapping.items()
+        )
+        self._read_all_sources = self._make_all_sources_reader()
+
+        # Background writer: one queue and daemon thread per data output, so that output I/O latency (e.g. csv file
+        # writes) does not delay the sampling loop
+        self._writer_queues: dict[str, queue.SimpleQueue] = {
+            do_name: queue.SimpleQueue() for do_name in self._data_outputs_mapping.keys()
+        }
+        self._writer_threads: dict[str, threading.Thread] = {}
+        self._start_writer_threads()
+
         # Count of logging
         self.log_count = 0
 
+    def _start_writer_threads(self):
+        """Start a writer thread for each data output, restart threads that have been stopped"""
+        for do_name, do in self._data_outputs_mapping.items():
+            thread = self._writer_threads.get(do_name)
+            if thread is not None and thread.is_alive():
+                continue
+            thread = threading.Thread(
+                target=self._writer_loop,
+                args=(do, self._writer_queues[do_name]),
+                name=f'DataOutputWriter-{do_name}',
+                daemon=True,
+            )
+            thread.start()
+            self._writer_threads[do_name] = thread
+
+    def stop_writer_threads(self):
+        """Stop all writer threads after draining the pending data in their queues"""
+        for do_name, thread in self._writer_threads.items():
+            if thread.is_alive():
+                self._writer_queues[do_name].put(None)  # Stop sentinel
+                thread.join()
+
+    @staticmethod
+    def _writer_loop(data_output: DataOutput.DataOutputBase, data_queue: queue.SimpleQueue):
+        """Consume data from the queue and log it to the data output until the stop sentinel (None) is received
+
+        After a blocking get, all immediately available data is drained in a tight loop, so bursts are written in
+        one go without a thread wakeup per item. A failing output (e.g. full disk, value rejected by a binary
+        format) must not kill the thread: the error is logged and the thread keeps consuming, otherwise the
+        sampling loop would silently enqueue into a dead thread's unbounded queue forever.
+        """
+        while True:
+            data = data_queue.get()
+            while data is not None:
+                try:
+                    data_output.log_data(data)
+                except Exception:
+                    logger.exception("Logging data to output %r failed, data discarded: %s", data_output, data)
+                try:
+                    data = data_queue.get_nowait()
+                except queue.Empty:
+                    break
+            else:
+                break  # Stop sentinel received
+
     def _check_data_source_name(self, data_source_name: str):
         """Check if data source name available in data sources"""
         if data_source_name not in self._data_sources_mapping.keys():
@@ -248,11 +355,15 @@ class DataLoggerBase(ABC):
     def _init_data_rename_mapping(self, data_rename_mapping: dict) -> dict[str, dict[str, dict[str, str]]]:
         """Init data rename mapping for all data sources to all data outputs, if the rename mapping for a variable
         name is unavailable, use its original name in the data source, the return has the same structure as
-        data_rename_mapping"""
+        data_rename_mapping
+
+        The resolved names are interned: the logging plans, the row templates and the outputs' variable name tuples
+        are all built from this mapping, so interning here makes their dict lookups succeed on pointer identity.
+        """
         return {
             ds_name: {
                 do_name: {
-                    var: data_rename_mapping.get(ds_name, {}).get(do_name, {}).get(var, var)
+                    var: sys.intern(data_rename_mapping.get(ds_name, {}).get(do_name, {}).get(var, var))
                     for var in ds.all_variable_names
                 }
                 for do_name in self._data_outputs_mapping.keys()
@@ -269,9 +380,8 @@ class DataLoggerBase(ABC):
             var_locs = {}
             for ds_name, output_dict in data_rename_mapping.items():
                 for var in output_dict[do_name].values():
-                    if var not in var_locs:
-                        var_locs[var] = []  # Init an empty list to save locations for this key
-                    var_locs[var].append(ds_name)
+                    # setdefault inits and fetches the location list with a single hash lookup
+                    var_locs.setdefault(var, []).append(ds_name)
             # Duplicates for this data output
             do_duplicates = {key: locs for key, locs in var_locs.items() if len(locs) > 1}
             # Save duplicates to overall dict
@@ -290,7 +400,7 @@ class DataLoggerBase(ABC):
             ds_name: {
                 do_name: {
                     # Keep the original do_name if no duplicates, else prefix with the ds_name
-                    key: var if do_name not in all_duplicates.keys() else f'{ds_name}{delimiter}{var}'
+                    key: var if do_name not in all_duplicates.keys() else sys.intern(f'{ds_name}{delimiter}{var}')
                     for key, var in mapping.items()
                 }
                 for do_name, mapping in output_dict.items()
@@ -298,47 +408,131 @@ class DataLoggerBase(ABC):
             for ds_name, output_dict in self._data_rename_mapping.items()
         }
 
+    def _init_log_data_plans(self) -> dict[str, tuple[str | None, tuple[tuple[str, str, str, str | None], ...]]]:
+        """Init logging plans for all data outputs
+
+        Each plan contains the key of log time (None if the output requires no log time) and a tuple of entries
+        (ds_name, var_name, renamed_name, data_type), resolved once from the rename and type conversion mappings.
+        """
+        plans = {}
+        for do_name, do in self._data_outputs_mapping.items():
+            entries = tuple(
+                (
+                    ds_name,
+                    var,
+                    self._data_rename_mapping[ds_name][do_name][var],
+                    None if self._data_type_conversion_mapping is None
+                    else self._data_type_conversion_mapping[ds_name][do_name][var],
+                )
+                for ds_name, ds in self._data_sources_mapping.items()
+                for var in ds.all_variable_names
+            )
+            plans[do_name] = (do.key_of_log_time if do.log_time_required else None, entries)
+        return plans
+
+    def _group_log_data_plans(self) -> tuple[tuple[tuple[str | None, tuple], tuple[str, ...], dict, callable], ...]:
+        """Group data outputs that share an identical logging plan
+
+        Outputs with the same resolved entries and the same key of log time receive identical row dicts, for such a
+        group the dict is built only once per sample and fanned out to all member outputs. Each group also gets a
+        pre-sized dict template with all keys set to None, copying it per sample is cheaper than growing a dict from
+        empty and keeps the hash table size stable across samples, and a row builder function specialized to the
+        group's plan entries, see '_compile_row_builder'.
+        """
+        groups: dict[tuple, list[str]] = {}
+        for do_name, plan in self._log_data_plans.items():
+            groups.setdefault(plan, []).append(do_name)
+        grouped = []
+        for (key_of_log_time, entries), do_names in groups.items():
+            keys = [renamed_var for _, _, renamed_var, _ in entries]
+            if key_of_log_time is not None:
+                keys.append(key_of_log_time)
+            grouped.append((
+                (key_of_log_time, entries), tuple(do_names), dict.fromkeys(keys),
+                self._compile_row_builder(entries),
+            ))
+        return tuple(grouped)
+
+    @classmethod
+    def _compile_row_builder(cls, entries: tuple[tuple[str, str, str, str | None], ...]):
+        """Compile a row builder function specialized to the given plan entries
+
+        The generated function hardcodes the source, variable and renamed names of every entry as constants, so
+        building a row runs a straight-line sequence of dict lookups and stores instead of interpreting the entry
+        tuples in a generic loop per sample. The type conversion is baked in only for entries that configure one.
+        """
+        lines = [
+            'def _build_row(data, template, convert):',
+            '    row = template.copy()',
+        ]
+        for ds_name, var, renamed_var, data_type in entries:
+            lines.append(f'    value = data[{ds_name!r}].get({var!r})')
+            lines.append('    if value is not None:')
+            if data_type is None:
+                lines.append(f'        row[{renamed_var!r}] = value')
+            else:
+                lines.append(f'        row[{renamed_var!r}] = convert(value, {data_type!r})')
+        lines.append('    return row')
+        namespace = {}
+        exec(compile('\n'.join(lines), '<log data plan>', 'exec'), namespace)
+        return namespace['_build_row']
+
+    def _make_all_sources_reader(self):
+        """Build a reader closure with the source names and read methods hard-bound as defaults
+
+        The common single-source case is specialized to a single store, the general case keeps one zip-free loop
+        over the pre-bound callables. The outer {source name: rows} dict is allocated once and refilled per sample:
+        its key set never changes, so reusing it avoids growing a fresh hash table on every tick. The per-source
+        row dicts themselves are freshly provided by 'read_data', no entry goes stale between samples.
+        """
+        scratch: dict[str, dict] = {}
+        if len(self._read_data_callables) == 1:
+            (ds_name, read_data), = self._read_data_callables
+
+            def read_all(ds_name=ds_name, read_data=read_data, scratch=scratch) -> dict[str, dict]:
+                scratch[ds_name] = read_data()
+                return scratch
+        else:
+            def read_all(read_data_callables=self._read_data_callables, scratch=scratch) -> dict[str, dict]:
+                for ds_name, read_data in read_data_callables:
+                    scratch[ds_name] = read_data()
+                return scratch
+        return read_all
+
     def read_data_all_sources(self) -> dict[str, dict]:
         """Read data from all data sources"""
-        return {
-            ds_name: ds.read_data()
-            for ds_name, ds in self._data_sources_mapping.items()
-        }
+        return self._read_all_sources()
 
-    def log_data_all_outputs(self, data: dict[str, dict], timestamp: str = None):
-        def process_variable_name(data_source_name: str, data_output_name: str, variable_name: str) -> str:
-            # Rename the variable based on rename mapping
-            return self._data_rename_mapping[data_source_name][data_output_name][variable_name]
-
-        def process_variable_value(data_source_name: str, data_output_name: str, variable_name: str, value):
-            if self._data_type_conversion_mapping is None:
-                # No data type conversion
-                return value
-            else:
-                return self.convert_data_type(
-                    value=value,
-                    data_type=self._data_type_conversion_mapping[data_source_name][data_output_name][variable_name]
-                )
+    async def read_data_all_sources_async(self) -> dict[str, dict]:
+        """Read data from all data sources concurrently
+
+        With I/O-bound sources the latency of a sample is then bounded by the slowest source instead of the sum of
+        all source latencies.
+        """
+        results = await asyncio.gather(*(ds.read_data_async() for ds in self._data_sources))
+        return dict(zip(self._data_sources_mapping.keys(), results))
 
+    def log_data_all_outputs(self, data: dict[str, dict], timestamp: str = None):
         """Log data to all data outputs"""
-        for do_name, do in self._data_outputs_mapping.items():
-            # Unzip and rename key for the current output
-            unzipped_data = {
-                process_variable_name(ds_name, do_name, var): process_variable_value(ds_name, do_name, var, value)
-                for ds_name, ds_data in data.items()
-                for var, value in ds_data.items()
-            }
+        convert_data_type = self.convert_data_type
+        for (key_of_log_time, entries), do_names, template, build_row in self._log_data_plan_groups:
+            # Unzip and rename keys once per plan group with the specialized row builder, starting from the
+            # pre-sized template with all values None, variables missing in the read data therefore stay None
+            unzipped_data = build_row(data, template, convert_data_type)
             # Add log time as settings
-            if do.log_time_required:
-                # This data output requires log time
+            if key_of_log_time is not None:
+                # These data outputs require log time
                 if timestamp is None:
-                    raise ValueError(f"The data output '{do}' requires timestamp but got None")
+                    raise ValueError(f"The data output(s) '{do_names}' require timestamp but got None")
                 else:
                     # Add timestamp to data
-                    unzipped_data[do.key_of_log_time] = timestamp
-            # Log data to this output
-            logger.debug(f"Logging data: {unzipped_data} to {do}")
-            do.log_data(unzipped_data)  # Log to output
+                    unzipped_data[key_of_log_time] = timestamp
+            # Log data to all outputs of the group via their writer threads, each writer thread gets its own dict
+            # instance because outputs may mutate the logged data (e.g. cleaning keys with none values)
+            logger.debug("Logging data: %s to %s", unzipped_data, do_names)
+            self._writer_queues[do_names[0]].put(unzipped_data)
+            for do_name in do_names[1:]:
+                self._writer_queues[do_name].put(dict(unzipped_data))
 
     @abstractmethod
     def run_data_logging(self, **kwargs):
@@ -355,8 +549,14 @@ class DataLoggerBase(ABC):
 
     @staticmethod
     def get_timestamp_now() -> str:
-        """Get the timestamp by now"""
-        return time.strftime('%Y-%m-%d %H:%M:%S', time.localtime())
+        """Get the timestamp by now, the formatted string is cached per second to avoid repeated conversions"""
+        global _timestamp_cache
+        now_sec = int(time.time())
+        cached_sec, cached_str = _timestamp_cache
+        if now_sec != cached_sec:
+            cached_str = time.strftime('%Y-%m-%d %H:%M:%S', time.localtime(now_sec))
+            _timestamp_cache = (now_sec, cached_str)
+        return cached_str
 
     @staticmethod
     def convert_data_type(value, data_type: str | None) -> bool | str | int | float | bytes | None:
@@ -383,11 +583,13 @@ class DataLoggerBase(ABC):
             else:
                 raise ValueError(f"Unsupported data type '{data_type}'")
         except ValueError:
-            logger.warning(f"Could not convert value '{value}' to type '{data_type}'")
+            logger.warning("Could not convert value '%s' to type '%s'", value, data_type)
             return value
 
 
 class DataLoggerTimeTrigger(DataLoggerBase):
+    __slots__ = ()
+
     def __init__(
             self,
             data_sources_mapping: dict[str, DataSource.DataSourceBase | DataSourceOutput.DataSourceOutputBase],
@@ -414,45 +616,223 @@ class DataLoggerTimeTrigger(DataLoggerBase):
             if duration <= 0:
                 raise ValueError(f"Logging duration '{duration}' should be 'None' or a value greater than 0")
 
+        # Init time values, the loop is paced with the monotonic clock, which is immune to wall clock jumps
+        # (e.g. NTP adjustments); the wall clock is only used for the human-readable log banner
+        wall_start_time = time.time()
+        start_time = time.monotonic()
+        end_time = None if duration is None else start_time + duration
+
+        logger.info(
+            f"Starting data logging at time {time.strftime('%Y-%m-%d %H:%M:%S', time.localtime(wall_start_time))}")
+        if end_time is None:
+            logger.info("Estimated end time: infinite")
+        else:
+            logger.info(f"Estimated end time "
+                        f"{time.strftime('%Y-%m-%d %H:%M:%S', time.localtime(wall_start_time + duration))}")
+
+        # Event-driven mode: sources exposing a file descriptor are read as soon as their data is ready instead of
+        # only at the fixed sampling times, which avoids wasted wakeups and blocking reads at low data rates
+        selector, early_data = self._create_source_selector()
+
+        # Create an interval timer fd for precise pacing, None if the platform does not support it; in event-driven
+        # mode the selector timeout paces the loop instead
+        timer_fd = None if selector is not None else self._create_interval_timer_fd(interval)
+
+        # Throttle the console progress to about once per second and preformat the template, so that fast intervals
+        # do not spend a write syscall on every sample
+        print_every = max(1, round(1.0 / interval))
+        print_fmt = f"TimeTrigger - {hex(id(self))} - Logging count(s): %d\n"
+
+        # Ensure the writer threads are running, e.g. after a previous run stopped them
+        self._start_writer_threads()
+
+        # Bind frequently used time functions and bound methods as locals to avoid attribute lookups per iteration
+        _mono = time.monotonic
+        _sleep = time.sleep
+        get_timestamp_now = self.get_timestamp_now
+        read_all_sources = self._read_all_sources
+        log_data_all_outputs = self.log_data_all_outputs
+
+        # Logging data
+        samples = 0
+        try:
+            while end_time is None or _mono() < end_time:
+                # Update next logging time, computed absolutely from the start time so that float rounding does not
+                # accumulate drift over long runs
+                samples += 1
+                next_log_time = start_time + interval * samples
+
+                # Get timestamp
+                timestamp = get_timestamp_now()
+
+                # Get data from all sources, sources already read by the selector are taken from the early buffer
+                if selector is None:
+                    data = read_all_sources()
+                else:
+                    # Pop with default instead of a membership check plus lookup, one hash probe per source
+                    data = {
+                        ds_name: early if (early := early_data.pop(ds_name, None)) is not None else read_data()
+                        for ds_name, read_data in self._read_data_callables
+                    }
+
+                # Log count
+                self.log_count += 1  # Update log counter
+                if self.log_count % print_every == 0:
+                    sys.stderr.write(print_fmt % self.log_count)  # Print count to console
+
+                # Log data to each output
+                log_data_all_outputs(data, timestamp)
+
+                if timer_fd is not None:
+                    # Block until the timer expires, the read value is the number of expirations since the last read
+                    expirations = int.from_bytes(os.read(timer_fd, 8), sys.byteorder)
+                    if expirations > 1:
+                        logger.warning("Data logging missed %d interval(s)", expirations - 1)
+                elif selector is not None:
+                    # Event-driven wait: wake up early whenever a source descriptor signals ready data
+                    self._wait_on_selector(selector, early_data, next_log_time)
+                else:
+                    # Fallback: calculate the time to sleep to maintain the interval
+                    sleep_time = next_log_time - _mono()
+                    if sleep_time > 0:
+                        _sleep(sleep_time)
+                    else:
+                        logger.warning("sleep_time = %s is negative", sleep_time)
+
+            # Finish data logging
+            logger.info("Data logging completed")
+        except KeyboardInterrupt:
+            logger.warning("Data logging stopped manually")
+        finally:
+            if timer_fd is not None:
+                os.close(timer_fd)
+            if selector is not None:
+                selector.close()
+            # Drain pending data so that all collected data is logged before returning
+            self.stop_writer_threads()
+            # Flush every output that buffers rows (csv, binary, columnar) so that all logged data is
+            # persisted on disk
+            for do in self._data_outputs:
+                flush = getattr(do, 'flush', None)
+                if flush is not None:
+                    flush()
+
+    async def run_data_logging_async(self, interval: int | float, duration: int | float | None):
+        """
+        Run data logging on an asyncio event loop
+        :param interval: Log interval in second
+        :param duration: Log duration in second, if None, the duration is infinite
+
+        All data sources are read concurrently via 'read_data_async', so the per-sample latency is bounded by the
+        slowest source instead of the sum of all source latencies. The loop is paced with the monotonic event loop
+        clock.
+        """
+        # Check the input
+        if interval <= 0:
+            raise ValueError(f"Logging interval '{interval}' should be greater than 0")
+        if duration is not None:
+            if duration <= 0:
+                raise ValueError(f"Logging duration '{duration}' should be 'None' or a value greater than 0")
+
         # Init time values
-        start_time = time.time()
+        loop = asyncio.get_running_loop()
+        wall_start_time = time.time()
+        start_time = loop.time()
         end_time = None if duration is None else start_time + duration
         next_log_time = start_time  # Init next logging time
 
-        logger.info(f"Starting data logging at time {time.strftime('%Y-%m-%d %H:%M:%S', time.localtime(start_time))}")
+        logger.info(
+            f"Starting data logging at time {time.strftime('%Y-%m-%d %H:%M:%S', time.localtime(wall_start_time))}")
         if end_time is None:
             logger.info("Estimated end time: infinite")
         else:
-            logger.info(f"Estimated end time {time.strftime('%Y-%m-%d %H:%M:%S', time.localtime(end_time))}")
+            logger.info(f"Estimated end time "
+                        f"{time.strftime('%Y-%m-%d %H:%M:%S', time.localtime(wall_start_time + duration))}")
+
+        # Throttle the console progress to about once per second, see 'run_data_logging'
+        print_every = max(1, round(1.0 / interval))
+        print_fmt = f"TimeTrigger - {hex(id(self))} - Logging count(s): %d\n"
+
+        # Ensure the writer threads are running, e.g. after a previous run stopped them
+        self._start_writer_threads()
 
         # Logging data
         try:
-            while end_time is None or time.time() < end_time:
+            while end_time is None or loop.time() < end_time:
                 # Update next logging time
                 next_log_time += interval
 
                 # Get timestamp
                 timestamp = self.get_timestamp_now()
 
-                # Get data from all sources
-                data = self.read_data_all_sources()
+                # Get data from all sources concurrently
+                data = await self.read_data_all_sources_async()
 
                 # Log count
                 self.log_count += 1  # Update log counter
-                print(f"TimeTrigger - {hex(id(self))} - Logging count(s): {self.log_count}")  # Print count to console
+                if self.log_count % print_every == 0:
+                    sys.stderr.write(print_fmt % self.log_count)  # Print count to console
 
                 # Log data to each output
                 self.log_data_all_outputs(data, timestamp)
 
                 # Calculate the time to sleep to maintain the interval
-                sleep_time = next_log_time - time.time()
+                sleep_time = next_log_time - loop.time()
                 if sleep_time > 0:
-                    logger.debug(f"sleep_time = {sleep_time}")
-                    time.sleep(sleep_time)
+                    await asyncio.sleep(sleep_time)
                 else:
-                    logger.warning(f"sleep_time = {sleep_time} is negative")
+                    logger.warning("sleep_time = %s is negative", sleep_time)
 
             # Finish data logging
             logger.info("Data logging completed")
-        except KeyboardInterrupt:
+        except (KeyboardInterrupt, asyncio.CancelledError):
             logger.warning("Data logging stopped manually")
+        finally:
+            # Drain pending data so that all collected data is logged before returning
+            self.stop_writer_threads()
+            # Flush every output that buffers rows (csv, binary, columnar) so that all logged data is
+            # persisted on disk
+            for do in self._data_outputs:
+                flush = getattr(do, 'flush', None)
+                if flush is not None:
+                    flush()
+
+    def _create_source_selector(self) -> tuple[selectors.BaseSelector | None, dict[str, dict]]:
+        """Create a selector for all data sources that expose a file descriptor, None if no source does
+
+        The second return value is the buffer for source data read early, keyed by the data source name.
+        """
+        fd_sources = [
+            (ds_name, ds) for ds_name, ds in self._data_sources_mapping.items() if ds.fileno() is not None]
+        if not fd_sources:
+            return None, {}
+        selector = selectors.DefaultSelector()
+        for ds_name, ds in fd_sources:
+            selector.register(ds.fileno(), selectors.EVENT_READ, data=(ds_name, ds.read_data))
+        logger.info(f"Event-driven reading activated for data source(s): {[n for n, _ in fd_sources]}")
+        return selector, {}
+
+    @staticmethod
+    def _wait_on_selector(selector: selectors.BaseSelector, early_data: dict[str, dict], next_log_time: float):
+        """Wait until the next logging time, reading sources as soon as their descriptors signal ready data"""
+        while True:
+            timeout = next_log_time - time.monotonic()
+            if timeout <= 0:
+                return
+            for key, _ in selector.select(timeout=timeout):
+                ds_name, read_data = key.data
+                early_data[ds_name] = read_data()
+
+    @staticmethod
+    def _create_interval_timer_fd(interval: int | float) -> int | None:
+        """Create a timer file descriptor that expires periodically with the logging interval
+
+        A timer fd (Linux, Python >= 3.12) provides far more precise periodic wakeups than 'time.sleep' and reports
+        missed intervals directly, which matters for sub-second logging intervals. On platforms without timerfd
+        support, None is returned and the caller falls back to sleep-based pacing.
+        """
+        if not hasattr(os, 'timerfd_create'):
+            return None
+        fd = os.timerfd_create(time.CLOCK_MONOTONIC)
+        os.timerfd_settime(fd, initial=interval, interval=interval)
+        return fd
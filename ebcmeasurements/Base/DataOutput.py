@@ -6,14 +6,22 @@ Data output module will always receive data in type 'dict' from data logger, wit
 
 from abc import ABC, abstractmethod
 from typing import TypedDict
+from ebcmeasurements.Base import Auxiliary
+import atexit
 import csv
+import math
 import os
-import logging.config
-# Load logging configuration from file
+import re
+import struct
+import time
+import logging
 logger = logging.getLogger(__name__)
 
 
 class DataOutputBase(ABC):
+    # Slots instead of a per-instance __dict__: smaller instances and faster attribute access in the hot loop
+    __slots__ = ('_all_variable_names', '_log_time_required')
+
     # Class attribute: key's name for the logged time
     key_of_log_time = 'LogTime'
 
@@ -39,15 +47,16 @@ class DataOutputBase(ABC):
     def generate_dir_of_file(file_name: str):
         """Generate a directory to save file if it does not exist"""
         dir_path = os.path.dirname(file_name)
-        if not os.path.exists(dir_path):
-            os.makedirs(dir_path)
+        if dir_path:
+            # One mkdir call that tolerates an existing dir, instead of a racy exists-then-makedirs check
+            os.makedirs(dir_path, exist_ok=True)
 
     @staticmethod
     def clean_keys_with_none_values(input_dict: dict) -> dict:
         """Clean keys that have none values"""
         keys_of_none_values = [k for k, v in input_dict.items() if v is None]
         if len(keys_of_none_values) > 0:
-            logger.debug(f"Found keys with none values: '{keys_of_none_values}, removing these keys ...")
+            logger.debug("Found keys with none values: '%s', removing these keys ...", keys_of_none_values)
             for _k in keys_of_none_values:
                 del input_dict[_k]
         return input_dict
@@ -73,19 +82,43 @@ class DataOutputBase(ABC):
 
 
 class DataOutputCsv(DataOutputBase):
+    __slots__ = (
+        'file_name', 'csv_writer_settings', '_file', '_csv_writer', '_needs_quoting', '_row_buffer',
+        '_last_flush_time', '_force_flush_after', '_rows_since_flush', '_numeric_only', '_batch', '_batch_size',
+        '_flush_interval',
+    )
+
     class CsvWriterSettings(TypedDict):
         """Typed dict for csv writer settings"""
         delimiter: str
 
+    # Class attribute: buffer size of the persistent file handle in bytes
+    _file_buffer_size = 65536
+
+    # Class attribute: maximum time in seconds that buffered rows may stay uncommitted to disk
+    _file_flush_interval = 5.0
+
     def __init__(
             self,
             file_name: str,
-            csv_writer_settings: 'DataOutputCsv.CsvWriterSettings' = None
+            csv_writer_settings: 'DataOutputCsv.CsvWriterSettings' = None,
+            buffer_size: int = None,
+            force_flush_after: int = None,
+            batch_size: int = None,
+            flush_interval: int | float = None
     ):
         """
         Initialize data output instance for csv data
         :param file_name: File name to save csv data with full path
         :param csv_writer_settings: Settings of csv writer, supported keys: 'delimiter', if None, use default settings
+        :param buffer_size: Buffer size of the file handle in bytes, if None, use the default of 64 KiB; larger
+            buffers collapse more rows into one write syscall at the price of more data at risk on a crash
+        :param force_flush_after: Force a flush to disk every given number of rows, if None, flush only when the
+            buffer is full, on the periodic flush interval, or on close
+        :param batch_size: Collect formatted rows and write them with a single call every given number of rows, if
+            None, write each row separately
+        :param flush_interval: Maximum time in seconds that buffered rows may stay uncommitted to disk, if None, use
+            the default of 5 seconds; whichever of batch size and flush interval is reached first triggers the write
         """
         logger.info("Initializing DataOutputCsv ...")
 
@@ -111,24 +144,422 @@ class DataOutputCsv(DataOutputBase):
             self.csv_writer_settings.update(csv_writer_settings)
             logger.info(f"Using csv writer settings: {self.csv_writer_settings}")
 
+        # Open a persistent buffered file handle and create the csv writer only once, instead of re-opening the file
+        # and re-creating the writer for each logged row
+        if buffer_size is not None and buffer_size <= 0:
+            raise ValueError(f"Buffer size '{buffer_size}' should be greater than 0")
+        if force_flush_after is not None and force_flush_after <= 0:
+            raise ValueError(f"Force flush after '{force_flush_after}' should be 'None' or greater than 0")
+        if batch_size is not None and batch_size <= 0:
+            raise ValueError(f"Batch size '{batch_size}' should be 'None' or greater than 0")
+        if flush_interval is not None and flush_interval <= 0:
+            raise ValueError(f"Flush interval '{flush_interval}' should be 'None' or greater than 0")
+        self._force_flush_after = force_flush_after
+        self._flush_interval = self._file_flush_interval if flush_interval is None else flush_interval
+        self._rows_since_flush = 0
+        self._batch_size = batch_size
+        self._batch: list[str] = []
+
+        self._file = open(
+            self.file_name, 'w', newline='',
+            buffering=self._file_buffer_size if buffer_size is None else buffer_size)
+        self._csv_writer = csv.writer(self._file, **self.csv_writer_settings)
+
+        # Fast path for rows without characters that require csv quoting: such rows are joined directly instead of
+        # running the csv writer's per-field quoting state machine, the csv writer remains as fallback
+        self._needs_quoting = re.compile(
+            '[%s"\r\n]' % re.escape(self.csv_writer_settings['delimiter'])).search
+
+        # Internal variable for property 'numeric_only', set by a DataLogger instance if all sources declare
+        # numeric-only values
+        self._numeric_only = False
+
+        # Reusable row buffer, sized to all variable names on first use, to avoid allocating a new list per row
+        self._row_buffer: list = []
+
+        # The buffered file handle batches writes up to '_file_buffer_size' bytes, a periodic forced flush ensures
+        # that slow logging rates still commit rows to disk promptly, and an atexit hook flushes on shutdown
+        self._last_flush_time = time.monotonic()
+        atexit.register(self.flush)
+
+    def __del__(self):
+        """Destructor method to ensure the file is closed"""
+        self.close()
+
     def log_data(self, data: dict):
         """Log data to csv"""
-        # Create a data dictionary based on the order of all variable names
-        reordered_data = {k: data.get(k, None) for k in self._all_variable_names}
-        self._append_to_csv(list(reordered_data.values()))  # Append data to csv
+        # Fill the reusable row buffer in the order of all variable names, the csv writer consumes the values
+        # immediately so the buffer can safely be reused for the next row
+        row = self._row_buffer
+        if len(row) != len(self._all_variable_names):
+            row = self._row_buffer = [None] * len(self._all_variable_names)
+        for idx, name in enumerate(self._all_variable_names):
+            row[idx] = data.get(name, None)
+        self._append_to_csv(row)  # Append data to csv
 
     def write_header_line(self):
         """Write header line as the first row of csv, this method must be called by initializing DataLogger"""
         self._write_to_csv(list(self._all_variable_names))
 
+    def flush(self):
+        """Write pending batched lines and flush the internal buffer to the file"""
+        if not self._file.closed:
+            self._write_batch()
+            self._file.flush()
+            self._last_flush_time = time.monotonic()
+
+    def close(self):
+        """Flush and close the file"""
+        file = getattr(self, '_file', None)  # The file may not exist if the initialization failed
+        if file is not None and not file.closed:
+            self._write_batch()
+            file.close()
+            atexit.unregister(self.flush)
+
     def _write_to_csv(self, row: list):
-        """Write a csv, the existing content in the file is erased as soon as the file is opened"""
-        with open(self.file_name, 'w', newline='') as f:
-            csv_writer = csv.writer(f, **self.csv_writer_settings)
-            csv_writer.writerow(row)
+        """Write a csv, the existing content in the file is erased"""
+        self._file.seek(0)
+        self._file.truncate()
+        self._csv_writer.writerow(row)
+        self._file.flush()
+
+    @property
+    def numeric_only(self) -> bool:
+        """If all logged values except the log time are numeric, enabling a faster row formatting path"""
+        return self._numeric_only
+
+    @numeric_only.setter
+    def numeric_only(self, value: bool):
+        self._numeric_only = value
 
     def _append_to_csv(self, row: list):
         """Append a new line to csv, the existing content in the file is preserved"""
-        with open(self.file_name, 'a', newline='') as f:
-            csv_writer = csv.writer(f, **self.csv_writer_settings)
-            csv_writer.writerow(row)
+        line = self._format_row(row)
+        if line is None:
+            # Rare case: a value requires quoting or escaping, commit pending batched lines first to preserve the
+            # row order, then delegate the row to the csv writer
+            self._write_batch()
+            self._csv_writer.writerow(row)
+        elif self._batch_size is None:
+            self._file.write(line)
+        else:
+            self._batch.append(line)
+            if len(self._batch) >= self._batch_size:
+                self._write_batch()
+        self._maybe_flush()
+
+    def _format_row(self, row: list) -> str | None:
+        """Format a row to one csv line, None if a value requires quoting and the csv writer must be used
+
+        The line terminator is the same as the one of the csv writer, so fast-path and fallback rows are
+        indistinguishable in the file.
+        """
+        delimiter = self.csv_writer_settings['delimiter']
+        if self._numeric_only:
+            # All values are numeric and the log time string never needs quoting, skip the per-field checks
+            return delimiter.join('' if value is None else str(value) for value in row) + '\r\n'
+        needs_quoting = self._needs_quoting
+        fields = []
+        for value in row:
+            if value is None:
+                fields.append('')
+            elif isinstance(value, str):
+                if needs_quoting(value):
+                    return None
+                fields.append(value)
+            else:
+                fields.append(str(value))
+        return delimiter.join(fields) + '\r\n'
+
+    def _write_batch(self):
+        """Write all batched lines with a single call"""
+        if self._batch:
+            self._file.write(''.join(self._batch))
+            self._batch.clear()
+
+    def _maybe_flush(self):
+        """Flush the file if the configured row count or the periodic flush interval is reached"""
+        if self._force_flush_after is not None:
+            self._rows_since_flush += 1
+            if self._rows_since_flush >= self._force_flush_after:
+                self.flush()
+                self._rows_since_flush = 0
+                return
+        if time.monotonic() - self._last_flush_time >= self._flush_interval:
+            self.flush()
+
+
+class DataOutputCsvRaw(DataOutputBase):
+    __slots__ = ('file_name', 'delimiter', '_fd', '_buf', '_buf_limit')
+
+    def __init__(self, file_name: str, delimiter: str = ';', buffer_limit: int = 65536):
+        """
+        Initialize data output instance for csv data via a raw file descriptor
+        :param file_name: File name to save csv data with full path
+        :param delimiter: Delimiter of csv-file
+        :param buffer_limit: Number of buffered bytes after which they are written to the descriptor in one call
+
+        This output bypasses Python's text layer entirely: rows are encoded to bytes once, collected in a bytearray
+        and written with os.write in large chunks, which removes the TextIOWrapper encoding step and its lock per
+        row. Values must not contain the delimiter, quotes or newlines, there is no csv escaping; for such data use
+        DataOutputCsv instead.
+        """
+        logger.info("Initializing DataOutputCsvRaw ...")
+
+        super().__init__(log_time_required=True)  # csv file always requires log time
+        self.file_name = file_name
+        self.generate_dir_of_file(self.file_name)  # Generate file path if not exists
+        self.delimiter = delimiter
+
+        if buffer_limit <= 0:
+            raise ValueError(f"Buffer limit '{buffer_limit}' should be greater than 0")
+        self._buf_limit = buffer_limit
+        self._buf = bytearray()
+        self._fd = os.open(self.file_name, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+        atexit.register(self.flush)
+
+    def __del__(self):
+        """Destructor method to ensure the descriptor is closed"""
+        self.close()
+
+    def log_data(self, data: dict):
+        """Log data to csv, buffered rows are written once the buffer limit is reached"""
+        fields = []
+        for name in self._all_variable_names:
+            value = data.get(name)
+            fields.append('' if value is None else str(value))
+        self._buf += self.delimiter.join(fields).encode() + b'\r\n'
+        if len(self._buf) >= self._buf_limit:
+            self.flush()
+
+    def write_header_line(self):
+        """Write header line as the first row of csv, this method must be called by initializing DataLogger"""
+        self._buf += self.delimiter.join(self._all_variable_names).encode() + b'\r\n'
+
+    def flush(self):
+        """Write the buffered bytes to the descriptor with a single call"""
+        if self._fd is not None and self._buf:
+            os.write(self._fd, self._buf)
+            self._buf.clear()
+
+    def close(self):
+        """Flush remaining buffered bytes and close the descriptor"""
+        fd = getattr(self, '_fd', None)  # The descriptor may not exist if the initialization failed
+        if fd is not None:
+            self.flush()
+            os.close(fd)
+            self._fd = None
+            atexit.unregister(self.flush)
+
+
+class DataOutputCsvMulti(DataOutputCsvRaw):
+    __slots__ = ('file_names', '_fds')
+
+    def __init__(self, file_names: list[str], delimiter: str = ';', buffer_limit: int = 65536):
+        """
+        Initialize data output instance that mirrors csv data to multiple files
+        :param file_names: File names to save csv data with full paths
+        :param delimiter: Delimiter of csv-files
+        :param buffer_limit: Number of buffered bytes after which they are written to the descriptors
+
+        Each row is formatted and encoded only once and the buffered bytes are handed to every descriptor with one
+        kernel call per file, so the formatting cost does not multiply with the fan-out. Like DataOutputCsvRaw there
+        is no csv escaping.
+        """
+        if not file_names:
+            raise ValueError("At least one file name is required")
+        super().__init__(file_name=file_names[0], delimiter=delimiter, buffer_limit=buffer_limit)
+        self.file_names = list(file_names)
+        for file_name in self.file_names[1:]:
+            self.generate_dir_of_file(file_name)
+        self._fds = [self._fd] + [
+            os.open(file_name, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644) for file_name in self.file_names[1:]]
+
+    def flush(self):
+        """Write the buffered bytes to every descriptor, each with a single call"""
+        if self._fd is not None and self._buf:
+            for fd in self._fds:
+                if hasattr(os, 'writev'):
+                    os.writev(fd, [self._buf])
+                else:
+                    os.write(fd, self._buf)
+            self._buf.clear()
+
+    def close(self):
+        """Flush remaining buffered bytes and close all descriptors"""
+        fds = getattr(self, '_fds', None)
+        if fds is None:
+            # Initialization failed before all descriptors were opened, close only the first one
+            super().close()
+        elif self._fd is not None:
+            self.flush()
+            for fd in fds:
+                os.close(fd)
+            self._fd = None
+            atexit.unregister(self.flush)
+
+
+class DataOutputBinary(DataOutputBase):
+    __slots__ = ('file_name', '_file', '_struct', '_field_names')
+
+    def __init__(self, file_name: str):
+        """
+        Initialize data output instance for fixed-width binary data
+        :param file_name: File name to save binary data with full path
+
+        Each logged row is stored as one fixed-width record: the log time as a 19-byte string followed by all other
+        variables as little-endian float64, with NaN for missing values. The field order and record layout are
+        written to '<file_name>.schema.json' once the variable names are known, so consumers can decode the records
+        without parsing text. Storing binary removes the float-to-string conversion of csv formatting entirely; only
+        numeric sources are supported.
+        """
+        logger.info("Initializing DataOutputBinary ...")
+
+        super().__init__(log_time_required=True)  # Records always contain the log time
+        self.file_name = file_name
+        self.generate_dir_of_file(self.file_name)  # Generate file path if not exists
+        self._file = open(self.file_name, 'wb')
+        self._struct = None  # Created on the first logged row, when all variable names are known
+        self._field_names: tuple[str, ...] = ()
+        atexit.register(self.flush)  # Commit buffered records on shutdown, like the csv outputs
+
+    def __del__(self):
+        """Destructor method to ensure the file is closed"""
+        self.close()
+
+    def log_data(self, data: dict):
+        """Log data as one fixed-width binary record"""
+        if self._struct is None:
+            self._init_struct()
+        values = [data.get(self.key_of_log_time, '').encode()]
+        for name in self._field_names:
+            value = data.get(name)
+            values.append(math.nan if value is None else value)
+        self._file.write(self._struct.pack(*values))
+
+    def flush(self):
+        """Flush the internal buffer to the file"""
+        if not self._file.closed:
+            self._file.flush()
+
+    def close(self):
+        """Flush and close the file"""
+        file = getattr(self, '_file', None)  # The file may not exist if the initialization failed
+        if file is not None and not file.closed:
+            file.close()
+            atexit.unregister(self.flush)
+
+    def _init_struct(self):
+        """Create the record struct and write the sidecar schema file"""
+        self._field_names = tuple(name for name in self._all_variable_names if name != self.key_of_log_time)
+        self._struct = struct.Struct('<19s' + 'd' * len(self._field_names))
+        Auxiliary.dump_json(
+            content={
+                'byte_order': 'little',
+                'record_size': self._struct.size,
+                'fields': [{'name': self.key_of_log_time, 'type': 'char[19]'}] + [
+                    {'name': name, 'type': 'float64'} for name in self._field_names],
+            },
+            file_name=f'{self.file_name}.schema.json',
+        )
+
+
+class DataOutputBufferedColumnar(DataOutputBase):
+    __slots__ = ('_np', 'file_name', 'chunk_size', 'delimiter', '_file', '_header_written', '_cols', '_idx')
+
+    def __init__(self, file_name: str, chunk_size: int = 1000, delimiter: str = ';'):
+        """
+        Initialize data output instance with a columnar chunk buffer
+        :param file_name: File name to save data with full path
+        :param chunk_size: Number of rows buffered per variable before a block is written to file
+        :param delimiter: Delimiter of the output file
+
+        Instead of writing each logged row separately, values are collected in one preallocated numpy array per
+        variable (structure of arrays) and written to file in blocks of 'chunk_size' rows. This keeps the per-sample
+        cost to plain array stores and suits columnar downstream consumers. All variables except the log time are
+        stored as float. Requires the optional dependency 'numpy'.
+        """
+        logger.info("Initializing DataOutputBufferedColumnar ...")
+
+        try:
+            import numpy
+        except ImportError:
+            raise ImportError(
+                "DataOutputBufferedColumnar requires the optional dependency 'numpy', "
+                "install it e.g. with 'pip install numpy'")
+
+        super().__init__(log_time_required=True)  # File always requires log time
+        self._np = numpy
+        self.file_name = file_name
+        self.generate_dir_of_file(self.file_name)  # Generate file path if not exists
+
+        if chunk_size <= 0:
+            raise ValueError(f"Chunk size '{chunk_size}' should be greater than 0")
+        self.chunk_size = chunk_size
+        self.delimiter = delimiter
+
+        self._file = open(self.file_name, 'w')
+        self._header_written = False
+        self._cols: list | None = None  # Allocated on the first logged row, when all variable names are known
+        self._idx = 0  # Number of buffered rows
+        atexit.register(self.flush)  # Commit buffered rows on shutdown, like the csv outputs
+
+    def __del__(self):
+        """Destructor method to ensure remaining buffered rows are written and the file is closed"""
+        self.close()
+
+    def log_data(self, data: dict):
+        """Log data into the columnar buffer, a full buffer is flushed to file as one block"""
+        cols = self._cols
+        if cols is None:
+            cols = self._cols = self._allocate_columns()
+        idx = self._idx
+        for name, col in zip(self._all_variable_names, cols):
+            value = data.get(name)
+            if value is not None:
+                col[idx] = value
+        self._idx = idx + 1
+        if self._idx == self.chunk_size:
+            self.flush()
+
+    def flush(self):
+        """Write the buffered rows to file as one block and reset the buffer"""
+        if self._idx == 0 or self._file.closed:
+            return
+        np = self._np
+        if not self._header_written:
+            self._file.write(self.delimiter.join(self._all_variable_names) + '\n')
+            self._header_written = True
+        block = np.empty((self._idx, len(self._cols)), dtype=object)
+        for i, col in enumerate(self._cols):
+            block[:, i] = col[:self._idx]
+        np.savetxt(self._file, block, fmt='%s', delimiter=self.delimiter)
+        self._file.flush()
+        self._reset_columns()
+
+    def close(self):
+        """Flush remaining buffered rows and close the file"""
+        file = getattr(self, '_file', None)  # The file may not exist if the initialization failed
+        if file is not None and not file.closed:
+            self.flush()
+            file.close()
+            atexit.unregister(self.flush)
+
+    def _allocate_columns(self) -> list:
+        """Allocate one array per variable, the log time as string and all other variables as float"""
+        np = self._np
+        return [
+            np.empty(self.chunk_size, dtype='<U19') if name == self.key_of_log_time
+            else np.full(self.chunk_size, np.nan)
+            for name in self._all_variable_names
+        ]
+
+    def _reset_columns(self):
+        """Reset all columns to unset values for the next chunk"""
+        np = self._np
+        for name, col in zip(self._all_variable_names, self._cols):
+            if name == self.key_of_log_time:
+                col[:] = ''
+            else:
+                col[:] = np.nan
+        self._idx = 0
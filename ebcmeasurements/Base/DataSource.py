@@ -5,11 +5,25 @@ Data source module must always provide data in type 'dict', with keys of variabl
 """
 
 from abc import ABC, abstractmethod
+import asyncio
 import random
+import sys
+
+try:
+    import numpy as np
+except ImportError:
+    np = None  # numpy is an optional dependency, the random sources then fall back to the random module
 
 
 class DataSourceBase(ABC):
     """Base class of data source"""
+    # Slots instead of a per-instance __dict__: smaller instances and faster attribute access in the hot loop
+    __slots__ = ('_all_variable_names',)
+
+    # Class attribute: if True, this source only provides numeric (or None) values, which allows outputs to skip
+    # text escaping; sources that may provide strings must leave it False
+    numeric_only = False
+
     def __init__(self):
         # Internal variable for property 'all_variable_names'
         # It should be defined during the initialization, e.g. from a configuration file, from inside the class, or
@@ -25,6 +39,24 @@ class DataSourceBase(ABC):
         """
         pass
 
+    async def read_data_async(self) -> dict:
+        """
+        Read data from source without blocking the event loop
+
+        This default implementation runs the synchronous 'read_data' in a worker thread. Child classes with native
+        asynchronous I/O can override it, so that the DataLogger can read multiple sources concurrently.
+        """
+        return await asyncio.to_thread(self.read_data)
+
+    def fileno(self) -> int | None:
+        """
+        File descriptor of this data source, None if the source does not expose one
+
+        Child classes backed by a socket or serial port can override this method. The DataLogger then waits on the
+        descriptor between samples and reads the source as soon as data is ready, instead of polling it blindly.
+        """
+        return None
+
     @property
     def all_variable_names(self) -> tuple[str, ...]:
         """
@@ -37,6 +69,10 @@ class DataSourceBase(ABC):
 
 
 class RandomDataSource(DataSourceBase):
+    __slots__ = ('size', 'key_missing_rate', 'value_missing_rate', '_rng')
+
+    numeric_only = True  # Provides only float values
+
     def __init__(self, size: int = 10, key_missing_rate: float = 0.5, value_missing_rate: float = 0.5):
         """
         Random data source to simulate data generation
@@ -55,10 +91,24 @@ class RandomDataSource(DataSourceBase):
         self.size = size
         self.key_missing_rate = key_missing_rate
         self.value_missing_rate = value_missing_rate
-        self._all_variable_names = tuple(f'RandData{n}' for n in range(self.size))  # Define all data names
+        self._rng = None if np is None else np.random.default_rng()  # Vectorized generator if numpy is available
+        # Interned names let dict lookups in the logging hot path succeed on pointer identity
+        self._all_variable_names = tuple(sys.intern(f'RandData{n}') for n in range(self.size))
 
     def read_data(self) -> dict[str, float]:
         """Generate random data for each variable name, randomly drop some keys, and randomly insert None values"""
+        if self._rng is not None:
+            # Vectorized path: generate all values and the key/value missing decisions with three C-level calls
+            # instead of up to three Python-level random calls per variable
+            rng = self._rng
+            values = rng.uniform(0.0, 100.0, self.size).tolist()
+            keep = (rng.random(self.size) >= self.key_missing_rate).tolist()
+            missing = (rng.random(self.size) < self.value_missing_rate).tolist()
+            return {
+                name: (None if missing[n] else values[n])
+                for n, name in enumerate(self._all_variable_names)
+                if keep[n]
+            }
         return {
             name: (None if random.random() < self.value_missing_rate else random.uniform(0.0, 100.0))
             for name in self._all_variable_names
@@ -67,6 +117,13 @@ class RandomDataSource(DataSourceBase):
 
 
 class RandomStringSource(RandomDataSource):
+    __slots__ = ('str_length',)
+
+    numeric_only = False  # Provides string values
+
+    # Class attribute: alphabet of the random strings
+    _chars = '1234567890AaBbCcDdEeFf'
+
     def __init__(
             self, size: int = 10, str_length: int = 5, key_missing_rate: float = 0.5, value_missing_rate: float = 0.5):
         """
@@ -80,22 +137,25 @@ class RandomStringSource(RandomDataSource):
         """
         super().__init__(size, key_missing_rate, value_missing_rate)
         self.str_length = str_length
-        self._all_variable_names = tuple(f'RandStr{n}' for n in range(self.size))  # Re-define all data names
+        self._all_variable_names = tuple(sys.intern(f'RandStr{n}') for n in range(self.size))  # Re-define all data names
 
     def read_data(self) -> dict[str, str]:
-        def generate_random_string(length: int) -> str:
-            """Generate random string with defined length"""
-            chars = '1234567890AaBbCcDdEeFf'
-            return ''.join(random.choice(chars) for _ in range(length))
-
+        """Generate random strings for each variable name, randomly drop some keys, and randomly insert None values"""
+        # Draw all characters with a single C-level call and slice per variable, instead of one random.choice call
+        # per character
+        length = self.str_length
+        chars = random.choices(self._chars, k=self.size * length)
         return {
-            name: (None if random.random() < self.value_missing_rate else generate_random_string(self.str_length))
-            for name in self._all_variable_names
+            name: (None if random.random() < self.value_missing_rate
+                   else ''.join(chars[n * length:(n + 1) * length]))
+            for n, name in enumerate(self._all_variable_names)
             if random.random() >= self.key_missing_rate
         }
 
 
 class RandomBooleanSource(RandomDataSource):
+    __slots__ = ()
+
     def __init__(
             self, size: int = 10, key_missing_rate: float = 0.5, value_missing_rate: float = 0.5):
         """
@@ -107,10 +167,22 @@ class RandomBooleanSource(RandomDataSource):
         Default variable names are formatted as 'RandBool<n>'.
         """
         super().__init__(size, key_missing_rate, value_missing_rate)
-        self._all_variable_names = tuple(f'RandBool{n}' for n in range(self.size))  # Re-define all data names
+        self._all_variable_names = tuple(sys.intern(f'RandBool{n}') for n in range(self.size))  # Re-define all data names
 
     def read_data(self) -> dict[str, bool]:
         """Generate random data for each variable name, randomly drop some keys, and randomly insert None values"""
+        if self._rng is not None:
+            # Vectorized path: generate all values and the key/value missing decisions with three C-level calls
+            # instead of up to three Python-level random calls per variable
+            rng = self._rng
+            values = (rng.integers(0, 2, self.size) == 1).tolist()
+            keep = (rng.random(self.size) >= self.key_missing_rate).tolist()
+            missing = (rng.random(self.size) < self.value_missing_rate).tolist()
+            return {
+                name: (None if missing[n] else values[n])
+                for n, name in enumerate(self._all_variable_names)
+                if keep[n]
+            }
         return {
             name: (None if random.random() < self.value_missing_rate else random.choice([True, False]))
             for name in self._all_variable_names
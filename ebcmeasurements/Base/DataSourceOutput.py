@@ -8,8 +8,7 @@ interface, e.g. Beckhoff PLC (ADS interface), MQTT (client interface)
 from abc import ABC
 from ebcmeasurements.Base import DataSource, DataOutput
 from typing import Optional
-import logging.config
-# Load logging configuration from file
+import logging
 logger = logging.getLogger(__name__)
 
 
@@ -17,12 +16,18 @@ class DataSourceOutputBase(ABC):
     """Base class of data source output"""
     class SystemDataSource(DataSource.DataSourceBase, ABC):
         """Nested class for data source operation"""
+        # Continue the slots layout of DataSourceBase; child classes without own __slots__ still get a __dict__
+        __slots__ = ('system',)
+
         def __init__(self, system: Optional[object]):
             super().__init__()
             self.system = system
 
     class SystemDataOutput(DataOutput.DataOutputBase, ABC):
         """Nested class for data output operation"""
+        # Continue the slots layout of DataOutputBase; child classes without own __slots__ still get a __dict__
+        __slots__ = ('system',)
+
         def __init__(self, system: Optional[object], log_time_required: Optional[bool]):
             super().__init__(log_time_required)
             self.system = system
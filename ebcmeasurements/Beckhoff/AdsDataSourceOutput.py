@@ -7,105 +7,317 @@ What is Automation Device Specification (ADS):
 
 from ebcmeasurements.Base import DataSourceOutput
 import pyads
-import time
+from pyads import pyads_ex
+import asyncio
+import queue
+import random
 import sys
-import logging.config
-# Load logging configuration from file
+import threading
+import time
+import logging
 logger = logging.getLogger(__name__)
 
 
+# Module-level route registry: registering the same AMS route repeatedly can stall the local router with
+# port-collision errors, so each (ams_net_id, ip_address) pair is added at most once per process
+_routes_lock = threading.Lock()
+_registered_routes: set[tuple[str, str]] = set()
+
+
+def _dense_code_table(codes: dict[int, str]) -> tuple[str | None, ...]:
+    """Dense tuple indexed by code, for code dicts with contiguous keys starting at 0"""
+    return tuple(codes.get(i) for i in range(max(codes) + 1))
+
+
+# ADS states
+_ADS_STATES_MAP = {
+    pyads.ADSSTATE_INVALID: 'Invalid',  # 0
+    pyads.ADSSTATE_IDLE: 'Idle',  # 1
+    pyads.ADSSTATE_RESET: 'Reset',  # 2
+    pyads.ADSSTATE_INIT: 'Init',  # 3
+    pyads.ADSSTATE_START: 'Start',  # 4
+    pyads.ADSSTATE_RUN: 'Run',  # 5
+    pyads.ADSSTATE_STOP: 'Stop',  # 6
+    pyads.ADSSTATE_SAVECFG: 'Save cfg',  # 7
+    pyads.ADSSTATE_LOADCFG: 'Load cfg',  # 8
+    pyads.ADSSTATE_POWERFAILURE: 'Power failure',  # 9
+    pyads.ADSSTATE_POWERGOOD: 'Power good',  # 10
+    pyads.ADSSTATE_ERROR: 'Error',  # 11
+    pyads.ADSSTATE_SHUTDOWN: 'Shut down',  # 12
+    pyads.ADSSTATE_SUSPEND: 'Suspend',  # 13
+    pyads.ADSSTATE_RESUME: 'Resume',  # 14
+    pyads.ADSSTATE_CONFIG: 'Config',  # 15: system is in config mode
+    pyads.ADSSTATE_RECONFIG: 'Re-config',  # 16: system should restart in config mode
+}
+
+# ADS return codes
+# https://infosys.beckhoff.com/content/1033/tc3_ads_intro/374277003.html?id=4954945278371876402
+_ADS_RETURN_CODES_MAP = {
+    0: 'No error',
+    1: 'Internal error',
+    2: 'No real time',
+    3: 'Allocation locked – memory error',
+    4: 'Mailbox full – the ADS message could not be sent. Reducing the number of ADS messages per cycle will help',
+    5: 'Wrong HMSG',
+    6: 'Target port not found – ADS server is not started, not reachable or not installed',
+    7: 'Target computer not found – AMS route was not found',
+    8: 'Unknown command ID',
+    9: 'Invalid task ID',
+    10: 'No IO',
+    11: 'Unknown AMS command',
+    12: 'Win32 error',
+    13: 'Port not connected',
+    14: 'Invalid AMS length',
+    15: 'Invalid AMS Net ID',
+    16: 'Installation level is too low –TwinCAT 2 license error',
+    17: 'No debugging available',
+    18: 'Port disabled – TwinCAT system service not started',
+    19: 'Port already connected',
+    20: 'AMS Sync Win32 error',
+    21: 'AMS Sync Timeout',
+    22: 'AMS Sync error',
+    23: 'No index map for AMS Sync available',
+    24: 'Invalid AMS port',
+    25: 'No memory',
+    26: 'TCP send error',
+    27: 'Host unreachable',
+    28: 'Invalid AMS fragment',
+    29: 'TLS send error – secure ADS connection failed',
+    30: 'Access denied – secure ADS access denied',
+}
+
+# Dense lookup tables built from the maps above. Both key ranges are contiguous from 0, so
+# '_plc_read_state' resolves the state strings with a plain index instead of dict hashing
+_ADS_STATES_TABLE = _dense_code_table(_ADS_STATES_MAP)
+_ADS_RETURN_CODES_TABLE = _dense_code_table(_ADS_RETURN_CODES_MAP)
+
+
 class AdsDataSourceOutput(DataSourceOutput.DataSourceOutputBase):
-    # Class attribute: ADS states
-    _ads_states_codes = {
-        pyads.ADSSTATE_INVALID: 'Invalid',  # 0
-        pyads.ADSSTATE_IDLE: 'Idle',  # 1
-        pyads.ADSSTATE_RESET: 'Reset',  # 2
-        pyads.ADSSTATE_INIT: 'Init',  # 3
-        pyads.ADSSTATE_START: 'Start',  # 4
-        pyads.ADSSTATE_RUN: 'Run',  # 5
-        pyads.ADSSTATE_STOP: 'Stop',  # 6
-        pyads.ADSSTATE_SAVECFG: 'Save cfg',  # 7
-        pyads.ADSSTATE_LOADCFG: 'Load cfg',  # 8
-        pyads.ADSSTATE_POWERFAILURE: 'Power failure',  # 9
-        pyads.ADSSTATE_POWERGOOD: 'Power good',  # 10
-        pyads.ADSSTATE_ERROR: 'Error',  # 11
-        pyads.ADSSTATE_SHUTDOWN: 'Shut down',  # 12
-        pyads.ADSSTATE_SUSPEND: 'Suspend',  # 13
-        pyads.ADSSTATE_RESUME: 'Resume',  # 14
-        pyads.ADSSTATE_CONFIG: 'Config',  # 15: system is in config mode
-        pyads.ADSSTATE_RECONFIG: 'Re-config',  # 16: system should restart in config mode
-    }
-
-    # Class attribute: ADS return codes
-    # https://infosys.beckhoff.com/content/1033/tc3_ads_intro/374277003.html?id=4954945278371876402
-    _ads_return_codes = {
-        0: 'No error',
-        1: 'Internal error',
-        2: 'No real time',
-        3: 'Allocation locked – memory error',
-        4: 'Mailbox full – the ADS message could not be sent. Reducing the number of ADS messages per cycle will help',
-        5: 'Wrong HMSG',
-        6: 'Target port not found – ADS server is not started, not reachable or not installed',
-        7: 'Target computer not found – AMS route was not found',
-        8: 'Unknown command ID',
-        9: 'Invalid task ID',
-        10: 'No IO',
-        11: 'Unknown AMS command',
-        12: 'Win32 error',
-        13: 'Port not connected',
-        14: 'Invalid AMS length',
-        15: 'Invalid AMS Net ID',
-        16: 'Installation level is too low –TwinCAT 2 license error',
-        17: 'No debugging available',
-        18: 'Port disabled – TwinCAT system service not started',
-        19: 'Port already connected',
-        20: 'AMS Sync Win32 error',
-        21: 'AMS Sync Timeout',
-        22: 'AMS Sync error',
-        23: 'No index map for AMS Sync available',
-        24: 'Invalid AMS port',
-        25: 'No memory',
-        26: 'TCP send error',
-        27: 'Host unreachable',
-        28: 'Invalid AMS fragment',
-        29: 'TLS send error – secure ADS connection failed',
-        30: 'Access denied – secure ADS access denied',
-    }
+    # Class attribute: backoff of the background reconnect thread in s
+    _reconnect_backoff_base = 0.5
+    _reconnect_backoff_cap = 30.0
 
     class AdsDataSource(DataSourceOutput.DataSourceOutputBase.SystemDataSource):
         """Ads implementation of nested class SystemDataSource"""
-        def __init__(self, system: pyads.Connection, all_variable_names: tuple[str, ...]):
+        # Slots instead of a per-instance __dict__: faster attribute access in the per-sample read path
+        __slots__ = ('_variable_names_list', '_connection_pool', '_read_groups', '_structure_name',
+                     '_structure_def', '_reconnect_event', '_symbols', '_last_written')
+
+        def __init__(
+                self,
+                system: pyads.Connection,
+                all_variable_names: tuple[str, ...],
+                device_notifications: bool = False,
+                connection_pool: 'queue.Queue[pyads.Connection] | None' = None,
+                structure_name: str | None = None,
+                structure_def: tuple | None = None,
+                reconnect_event: threading.Event | None = None,
+                last_written: dict | None = None
+        ):
+            """
+            Initialization of AdsDataSource instance
+
+            :param system: See package pyads.Connection
+            :param all_variable_names: All variable names to be read from PLC
+            :param device_notifications: If True, register one ADS device notification per variable and let the
+            PLC push value changes into the process; 'read_data' then returns the latest pushed values without any
+            ADS round-trip. If False, each 'read_data' polls the PLC with a single sum-read request
+            :param connection_pool: Pool of open connections to check reads out of, None to always read via
+            'system'. With a pool, concurrent readers and writers do not serialize on a single AMS port
+            :param structure_name: Name of a PLC structure that contains all variables to be read. If given
+            together with 'structure_def', each 'read_data' issues a single 'read_structure_by_name' call instead
+            of a sum-read, which collapses the per-variable sub-requests into one contiguous read
+            :param structure_def: Structure definition as expected by pyads.Connection.read_structure_by_name,
+            e.g. (('var1', pyads.PLCTYPE_REAL, 1), ...); the member names become the variable names
+            :param reconnect_event: Event shared with the background reconnect thread of the combined system. A
+            failed read sets it and returns empty data instead of raising, so the sample cadence never blocks on
+            a retry; None to raise read errors directly
+            :param last_written: Dict shared with AdsDataOutput holding the values this process last wrote.
+            Variables found in it are reused from the cache instead of re-fetched from the PLC, see
+            'coalesce_overlapping_reads' on AdsDataSourceOutput; None to always poll all variables
+            """
             logger.info("Initializing AdsDataSource ...")
             super().__init__(system)
-            self._all_variable_names = all_variable_names
+            # Interned names let dict lookups in the logging hot path succeed on pointer identity
+            self._all_variable_names = tuple(map(sys.intern, all_variable_names))
+            # Pre-built list for 'read_list_by_name', avoids converting the tuple on every read cycle
+            self._variable_names_list = list(all_variable_names)
+            self._connection_pool = connection_pool
+            # Name groups for concurrent reads in 'read_data_async': one chunk per pooled connection, so all
+            # chunks can be requested in parallel and the cycle costs ~max instead of the sum of the round-trips
+            self._read_groups = None
+            if connection_pool is not None:
+                pool_size = connection_pool.qsize()  # All connections are checked in during initialization
+                chunk_size = max(1, -(-len(self._variable_names_list) // pool_size))  # Ceiling division
+                self._read_groups = tuple(
+                    self._variable_names_list[i:i + chunk_size]
+                    for i in range(0, len(self._variable_names_list), chunk_size))
+            if (structure_name is None) != (structure_def is None):
+                raise ValueError("'structure_name' and 'structure_def' must be given together")
+            self._structure_name = structure_name
+            self._structure_def = structure_def
+            self._reconnect_event = reconnect_event
+            self._last_written = last_written
+            self._symbols = None
+            if device_notifications:
+                # Symbols with auto update keep their value current via device notifications registered on the
+                # PLC, so reading them is a local attribute access instead of an ADS round-trip
+                self._symbols = tuple(system.get_symbol(name) for name in all_variable_names)
+                for symbol in self._symbols:
+                    symbol.auto_update = True
 
         def read_data(self) -> dict:
-            return self.system.read_list_by_name(list(self._all_variable_names))
+            event = self._reconnect_event
+            if event is not None and event.is_set():
+                # Reconnect runs in the background; return no data instead of blocking the sample cadence
+                return {}
+            if self._symbols is not None:
+                # Values pushed by the PLC via device notifications, zero ADS round-trips per logging tick
+                return {name: symbol.value for name, symbol in zip(self._all_variable_names, self._symbols)}
+            try:
+                if self._structure_name is not None:
+                    # One contiguous read of the whole structure: no per-variable sub-requests at all
+                    return self.system.read_structure_by_name(self._structure_name, self._structure_def)
+                names = self._variable_names_list
+                written = self._last_written
+                if written:
+                    # Snapshot the shared cache once per call: the reconnect thread clears it on connection
+                    # loss, and a clear between membership test and lookup would raise KeyError here. The
+                    # dict copy is atomic under the GIL, so all accesses below see one consistent state.
+                    written = dict(written)
+                    # Reuse values this process wrote last instead of re-fetching them from the PLC; only
+                    # valid when the PLC does not change these symbols itself, see the opt-in flag
+                    names = [n for n in names if n not in written]
+                    if not names:
+                        return {n: written[n] for n in self._variable_names_list}
+                # Single ADS sum-read request for all variables; pyads resolves the symbol info once on the
+                # first call and caches it ('cache_symbol_info'), so steady-state reads cost one round-trip
+                # instead of one per variable
+                if self._connection_pool is None:
+                    data = self.system.read_list_by_name(names, cache_symbol_info=True)
+                else:
+                    connection = self._connection_pool.get()
+                    try:
+                        data = connection.read_list_by_name(names, cache_symbol_info=True)
+                    finally:
+                        self._connection_pool.put(connection)
+                if written:
+                    for n in self._variable_names_list:
+                        if n in written:
+                            data[n] = written[n]
+                return data
+            except pyads.ADSError:
+                if event is None:
+                    raise
+                logger.warning("ADS read failed, triggering background reconnect ...")
+                event.set()
+                return {}
+
+        def _read_group(self, group: list[str]) -> dict:
+            """Read one name group on a pooled connection, executed in a worker thread by 'read_data_async'"""
+            connection = self._connection_pool.get()
+            try:
+                return connection.read_list_by_name(group, cache_symbol_info=True)
+            finally:
+                self._connection_pool.put(connection)
+
+        async def read_data_async(self) -> dict:
+            """
+            Read data from PLC without blocking the event loop
+
+            With a connection pool, the variable names are split into one chunk per pooled connection and all
+            chunks are requested concurrently, so the cycle takes about the slowest round-trip instead of their
+            sum. Without a pool (or with device notifications), this falls back to running 'read_data' in a
+            worker thread.
+            """
+            if (self._symbols is not None or self._structure_name is not None
+                    or self._connection_pool is None or len(self._read_groups) <= 1):
+                return await asyncio.to_thread(self.read_data)
+            results = await asyncio.gather(
+                *(asyncio.to_thread(self._read_group, group) for group in self._read_groups))
+            data = {}
+            for result in results:
+                data.update(result)
+            return data
 
     class AdsDataOutput(DataSourceOutput.DataSourceOutputBase.SystemDataOutput):
         """Ads implementation of nested class SystemDataOutput"""
-        def __init__(self, system: pyads.Connection, all_variable_names: tuple[str, ...]):
+        # Slots instead of a per-instance __dict__: faster attribute access in the per-sample write path
+        __slots__ = ('_connection_pool', '_reconnect_event', '_last_written')
+
+        def __init__(
+                self,
+                system: pyads.Connection,
+                all_variable_names: tuple[str, ...],
+                connection_pool: 'queue.Queue[pyads.Connection] | None' = None,
+                reconnect_event: threading.Event | None = None,
+                last_written: dict | None = None
+        ):
+            """
+            Initialization of AdsDataOutput instance
+
+            :param system: See package pyads.Connection
+            :param all_variable_names: All variable names to be logged to PLC
+            :param connection_pool: Pool of open connections to check writes out of, None to always write via
+            'system', see AdsDataSource
+            :param reconnect_event: Event shared with the background reconnect thread, a failed write sets it
+            and skips the data instead of raising, see AdsDataSource
+            :param last_written: Dict shared with AdsDataSource, updated with each successfully written value
+            so overlapping reads can be served from it, see AdsDataSource; None to disable
+            """
             logger.info("Initializing AdsDataOutput ...")
             super().__init__(system, log_time_required=False)  # No requires of log time
-            self._all_variable_names = all_variable_names
+            self._all_variable_names = tuple(map(sys.intern, all_variable_names))
+            self._connection_pool = connection_pool
+            self._reconnect_event = reconnect_event
+            self._last_written = last_written
 
         def log_data(self, data: dict):
             """Log data"""
-            if data:
-                data_cleaned = self.clean_keys_with_none_values(data)  # Clean none values
-                if data_cleaned:
+            event = self._reconnect_event
+            if event is not None and event.is_set():
+                # Reconnect runs in the background; drop the data instead of blocking the sample cadence
+                return
+            if not data:
+                logger.debug("No keys available in data, skipping logging ...")
+                return
+            # Short-circuit precheck: skip the dict build and the ADS call entirely if every value is None;
+            # exits on the first non-None value
+            if not any(v is not None for v in data.values()):
+                logger.info("No more keys after cleaning the data, skipping logging ...")
+                return
+            # One-pass filter of none values: builds the write dict directly instead of collecting keys to
+            # delete and mutating the input dict afterwards
+            data_cleaned = {k: v for k, v in data.items() if v is not None}
+            try:
+                if self._connection_pool is None:
                     self.system.write_list_by_name(data_cleaned)
                 else:
-                    logger.info("No more keys after cleaning the data, skipping logging ...")
-            else:
-                logger.debug("No keys available in data, skipping logging ...")
+                    connection = self._connection_pool.get()
+                    try:
+                        connection.write_list_by_name(data_cleaned)
+                    finally:
+                        self._connection_pool.put(connection)
+                if self._last_written is not None:
+                    self._last_written.update(data_cleaned)
+            except pyads.ADSError:
+                if event is None:
+                    raise
+                logger.warning("ADS write failed, triggering background reconnect ...")
+                event.set()
 
     def __init__(
             self,
             ams_net_id: str,
             ams_net_port: int = pyads.PORT_TC3PLC1,
             source_data_names: list[str] | None = None,
-            output_data_names: list[str] | None = None
+            output_data_names: list[str] | None = None,
+            source_device_notifications: bool = False,
+            connection_pool_size: int = 1,
+            source_structure_name: str | None = None,
+            source_structure_def: tuple | None = None,
+            ip_address: str | None = None,
+            coalesce_overlapping_reads: bool = False
     ):
         """
         Initialization of AdsDataSourceOutput instance
@@ -117,6 +329,21 @@ class AdsDataSourceOutput(DataSourceOutput.DataSourceOutputBase):
         :param ams_net_port: See package pyads.Connection.ams_net_port
         :param source_data_names: List of source names to be read from PLC, None to deactivate read function
         :param output_data_names: List of output names to be logged to PLC, None to deactivate write function
+        :param source_device_notifications: If True, the data source receives values pushed by the PLC via ADS
+        device notifications instead of polling, see AdsDataSource
+        :param connection_pool_size: Number of parallel ADS connections. With the default of 1, all reads and
+        writes go through a single connection; larger values let concurrent reader and writer threads issue
+        requests in parallel instead of serializing on one AMS port
+        :param source_structure_name: Name of a PLC structure containing all source variables, to read them with
+        a single contiguous read instead of a sum-read, see AdsDataSource
+        :param source_structure_def: Structure definition belonging to 'source_structure_name', see AdsDataSource
+        :param ip_address: IP address of the PLC to register a client-side AMS route for (Linux only, where no
+        TwinCAT router manages routes). Each route is added at most once per process; None to manage routes
+        externally as before
+        :param coalesce_overlapping_reads: If True, variables that appear in both 'source_data_names' and
+        'output_data_names' are served from the values this process last wrote instead of being re-fetched from
+        the PLC each cycle. Only enable this if the PLC does not change these symbols itself, otherwise
+        server-side changes would be missed
 
         Default variable names are the same as in TwinCAT, formatted as '<struct 1>.<struct 2>...<variable>'.
         """
@@ -125,52 +352,119 @@ class AdsDataSourceOutput(DataSourceOutput.DataSourceOutputBase):
         self.ams_net_port = ams_net_port
         self._source_data_names = source_data_names
         self._output_data_names = output_data_names
+        self._source_device_notifications = source_device_notifications
+        self._source_structure_name = source_structure_name
+        self._source_structure_def = source_structure_def
+        # Shared write-through cache for overlapping source/output names, None if coalescing is disabled
+        self._last_written = {} if coalesce_overlapping_reads else None
+
+        if connection_pool_size < 1:
+            raise ValueError(f"connection_pool_size '{connection_pool_size}' must be at least 1")
+
+        # Register the client-side AMS route once per process and PLC
+        if ip_address is not None:
+            with _routes_lock:
+                route = (self.ams_net_id, ip_address)
+                if route not in _registered_routes:
+                    logger.info(f"Adding AMS route to '{self.ams_net_id}' via '{ip_address}' ...")
+                    pyads.add_route(self.ams_net_id, ip_address)
+                    _registered_routes.add(route)
 
         # Config PLC
         super().__init__()
-        self.system = pyads.Connection(self.ams_net_id, self.ams_net_port)
+        self.system = pyads.Connection(self.ams_net_id, self.ams_net_port, ip_address)
+
+        # Connection pool: the primary connection plus extra ones, each with its own AMS port, checked out per
+        # read or write call by the data source and data output; None with pool size 1
+        self._connection_pool = None
+        self._extra_connections = [
+            pyads.Connection(self.ams_net_id, self.ams_net_port, ip_address)
+            for _ in range(connection_pool_size - 1)]
+        if self._extra_connections:
+            self._connection_pool = queue.Queue()
+            for connection in [self.system] + self._extra_connections:
+                self._connection_pool.put(connection)
 
         # Init connection state
         self.plc_connected = False
 
-        # Connect PLC with retries
-        self._plc_connect_with_retry(max_retries=5, retry_period=2)
+        # Connect PLC with retries; raising instead of exiting leaves it to the caller whether to retry the
+        # construction or abort, e.g. long-running loggers can back off across transient PLC outages
+        self._plc_connect_with_retry(max_retries=5)
         if self.plc_connected:
             logger.info(f"Connect to PLC successfully")
         else:
-            logger.error(f"Connect to PLC failed, exiting ...")
-            sys.exit(1)
+            raise ConnectionError(f"Connect to PLC '{self.ams_net_id}' failed after 5 attempts")
 
-    def __del__(self):
-        """Destructor method to ensure PLC disconnected"""
+        # Background reconnect: a failed read or write sets the event, the monitor thread then re-establishes
+        # the connection with exponential backoff while the logging cadence continues with empty samples
+        self._reconnect_event = threading.Event()
+        self._stop_event = threading.Event()
+        self._reconnect_thread = threading.Thread(target=self._reconnect_loop, daemon=True, name='AdsReconnect')
+        self._reconnect_thread.start()
+
+    def close(self):
+        """Stop the background reconnect thread and disconnect the PLC
+
+        The reconnect thread holds a reference to this instance, so without an explicit close the instance (and
+        its open ADS connections) would stay alive for the whole process lifetime.
+        """
+        self._stop_event.set()
+        self._reconnect_event.set()  # Wake the reconnect thread so it observes the stop request
+        if self._reconnect_thread.is_alive():
+            self._reconnect_thread.join()
         if self.system.is_open:
             self._plc_close()
         else:
             logger.info("PLC already disconnected")
 
+    def __del__(self):
+        """Destructor method to ensure the reconnect thread is stopped and PLC disconnected"""
+        if getattr(self, '_stop_event', None) is not None:
+            self.close()
+        elif getattr(self, 'system', None) is not None and self.system.is_open:
+            # Initialization failed before the reconnect thread was set up, only the connection needs closing
+            self._plc_close()
+
     def _plc_connect(self):
-        """Try to connect PLC only once"""
+        """Ensure PLC connection: no side effects and no ADS round-trip if already connected"""
         if self.plc_connected:
+            # A healthy connection is trusted until a pyads error proves otherwise, so no state read here
+            logger.debug("PLC already connected")
+        else:
+            self._plc_establish()
+
+    def _plc_establish(self):
+        """Try to open the PLC connection once, reading the PLC state a single time on success"""
+        try:
+            logger.info(f"Connecting PLC ...")
+            # Connect PLC
+            self.system.open()
+            for connection in self._extra_connections:
+                connection.open()
+
             # Read PLC state
             plc_state = self._plc_read_state()
-            logger.info(f"PLC already connected: ADS state - '{plc_state[0]}', device state - '{plc_state[1]}'")
-        else:
-            try:
-                logger.info(f"Connecting PLC ...")
-                # Connect PLC
-                self.system.open()
+            logger.info(f"PLC connected: ADS state - '{plc_state[0]}', device state - '{plc_state[1]}'")
 
-                # Read PLC state
-                plc_state = self._plc_read_state()
-                logger.info(f"PLC connected: ADS state - '{plc_state[0]}', device state - '{plc_state[1]}'")
+            # Update state
+            self.plc_connected = True
 
-                # Update state
-                self.plc_connected = True
-            except pyads.ADSError:
-                logger.warning(f"PLC connection failed")
+            # Resolve symbol info for all configured variables once, so the first logging tick already runs
+            # as a single sum-read / sum-write without per-symbol lookups
+            self._plc_warm_symbol_cache()
+        except pyads.ADSError:
+            logger.warning(f"PLC connection failed")
+
+    def _plc_connect_with_retry(
+            self, max_retries: int = 5, base: float = 0.1, cap: float = 5.0, jitter: float = 0.5):
+        """
+        Connect PLC with multiple retries
 
-    def _plc_connect_with_retry(self, max_retries: int = 5, retry_period: int = 2):
-        """Connect PLC with multiple retries"""
+        Waits between attempts with exponential backoff plus jitter: transient errors recover after 'base'
+        seconds instead of a fixed period, and several clients retrying during an outage do not hammer the ADS
+        router in lockstep.
+        """
         attempt = 1
         while attempt <= max_retries:
             logger.info(f"Connecting PLC with attempt(s): {attempt}/{max_retries} ...")
@@ -178,19 +472,80 @@ class AdsDataSourceOutput(DataSourceOutput.DataSourceOutputBase):
             if self.plc_connected or attempt == max_retries:
                 break
             else:
+                time.sleep(min(cap, base * 2 ** (attempt - 1)) + random.uniform(0, jitter))
                 attempt += 1
-                time.sleep(retry_period)
+
+    def _reconnect_loop(self):
+        """
+        Background reconnect with exponential backoff, woken by a failed read or write
+
+        Runs in a daemon thread so retry sleeps never block the sample cadence; the data source and data output
+        skip their ADS calls while the event is set and resume once the connection is re-established. The loop
+        exits once 'close' sets the stop event.
+        """
+        while not self._stop_event.is_set():
+            self._reconnect_event.wait()
+            if self._stop_event.is_set():
+                break
+            logger.warning("PLC connection lost, reconnecting in background ...")
+            self.plc_connected = False
+            if self._last_written is not None:
+                # Cached write-through values may be stale after a connection loss
+                self._last_written.clear()
+            try:
+                self._plc_close()
+            except pyads.ADSError:
+                pass
+            delay = self._reconnect_backoff_base
+            while not self.plc_connected and not self._stop_event.is_set():
+                self._plc_connect()
+                if not self.plc_connected:
+                    self._stop_event.wait(delay)  # Interruptible backoff sleep, so close() never blocks on it
+                    delay = min(delay * 2, self._reconnect_backoff_cap)
+            self._reconnect_event.clear()
+
+    def _plc_warm_symbol_cache(self):
+        """
+        Pre-populate the symbol info cache of the connection for all configured source and output names
+
+        Symbol info resolved here is reused by 'read_list_by_name' and 'write_list_by_name' in the hot loop. Names
+        that cannot be resolved are logged and skipped, they will raise later on first use.
+        """
+        cache = self.system._symbol_info_cache
+        for name in (self._source_data_names or []) + (self._output_data_names or []):
+            if name not in cache:
+                try:
+                    cache[name] = pyads_ex.adsGetSymbolInfo(self.system._port, self.system._adr, name)
+                except pyads.ADSError:
+                    logger.warning(f"Unable to resolve symbol info for '{name}'")
+        # Pool members share the resolved symbol info, so no connection re-resolves in the hot loop
+        for connection in self._extra_connections:
+            connection._symbol_info_cache.update(cache)
 
     def _plc_close(self):
         """Close PLC: close the connection to the TwinCAT message router"""
         logger.info("Disconnecting PLC ...")
+        # De-register device notifications before closing, otherwise they stay active on the PLC
+        if self._data_source is not None and self._data_source._symbols is not None:
+            for symbol in self._data_source._symbols:
+                symbol.auto_update = False
         self.system.close()
+        for connection in self._extra_connections:
+            connection.close()
+        # Drop cached symbol info: after a reconnect the PLC may run a re-compiled project with shifted symbol
+        # addresses, so the cache must be rebuilt by '_plc_connect'
+        self.system._symbol_info_cache.clear()
+        for connection in self._extra_connections:
+            connection._symbol_info_cache.clear()
+        self.plc_connected = False
 
     def _plc_read_state(self) -> tuple[str, str]:
         """Read the current ADS state and the device state"""
-        logger.info("Reading ADS state and device state ...")
+        logger.debug("Reading ADS state and device state ...")
         ads_state_int, device_state_int = self.system.read_state()
-        return self._ads_states_codes.get(ads_state_int), self._ads_return_codes.get(device_state_int)
+        states, codes = _ADS_STATES_TABLE, _ADS_RETURN_CODES_TABLE
+        return (states[ads_state_int] if ads_state_int < len(states) else None,
+                codes[device_state_int] if device_state_int < len(codes) else None)
 
     @property
     def data_source(self) -> 'AdsDataSourceOutput.AdsDataSource':
@@ -201,7 +556,14 @@ class AdsDataSourceOutput(DataSourceOutput.DataSourceOutputBase):
             else:
                 # Lazy initialization with properties
                 self._data_source = self.AdsDataSource(
-                    system=self.system, all_variable_names=tuple(self._source_data_names))
+                    system=self.system,
+                    all_variable_names=tuple(self._source_data_names),
+                    device_notifications=self._source_device_notifications,
+                    connection_pool=self._connection_pool,
+                    structure_name=self._source_structure_name,
+                    structure_def=self._source_structure_def,
+                    reconnect_event=self._reconnect_event,
+                    last_written=self._last_written)
         return self._data_source
 
     @property
@@ -213,13 +575,17 @@ class AdsDataSourceOutput(DataSourceOutput.DataSourceOutputBase):
             else:
                 # Lazy initialization with properties
                 self._data_output = self.AdsDataOutput(
-                    system=self.system, all_variable_names=tuple(self._output_data_names))
+                    system=self.system,
+                    all_variable_names=tuple(self._output_data_names),
+                    connection_pool=self._connection_pool,
+                    reconnect_event=self._reconnect_event,
+                    last_written=self._last_written)
         return self._data_output
 
     @property
     def ads_states_codes(self) -> dict:
-        return self._ads_states_codes
+        return _ADS_STATES_MAP
 
     @property
     def ads_return_codes(self) -> dict:
-        return self._ads_return_codes
+        return _ADS_RETURN_CODES_MAP
@@ -4,9 +4,9 @@ Module IcpdasDataSourceOutput: Interface of ICP DAS to DataLogger
 from ebcmeasurements.Base import DataSourceOutput, Auxiliary
 from ebcmeasurements.Icpdas import IoBase, IoSeries_I87K
 import re
-import os
-import logging.config
-# Load logging configuration from file
+import pathlib
+import sys
+import logging
 logger = logging.getLogger(__name__)
 
 
@@ -16,16 +16,32 @@ class IcpdasDataSourceOutput(DataSourceOutput.DataSourceOutputBase):
         def __init__(self, system: tuple[IoBase.EthernetIoModule, ...]):
             logger.info("Initializing IcpdasDataSource ...")
             super().__init__(system)
-            # Set variable names as 'Mo<slot index>Ch<channel index>'
-            self._all_variable_names = tuple(f'Mo{m.slot_idx}Ch{ch}' for m in self.system for ch in range(m.io_channel))
+            # Set variable names as 'Mo<slot index>Ch<channel index>', interned so dict lookups in the logging hot
+            # path succeed on pointer identity
+            self._all_variable_names = tuple(
+                sys.intern(f'Mo{m.slot_idx}Ch{ch}') for m in self.system for ch in range(m.io_channel))
+            # All modules share the same I/O unit; pre-collect its handle and the all-channels read commands,
+            # so each poll pipelines all commands in one send instead of one round-trip per module
+            self._io_unit = self.system[0].io_unit
+            self._ai_cmds = tuple(m._ai_all_cmd for m in self.system)
+            # Per-module variable name prefixes, so the poll loop concatenates instead of formatting f-strings
+            self._prefixes = tuple(f'Mo{m.slot_idx}' for m in self.system)
 
         def read_data(self) -> dict:
             data = {}
-            # Read data by looping each module
-            for m in self.system:
-                # Read data for all channels, return is {'Ch0': <value0>, 'Ch1': <value1>, ...}
-                module_data = m.read_analog_input_all_channels()
-                data.update({f'Mo{m.slot_idx}{k}': v for k, v in module_data.items()})
+            # Pipeline the read commands of all modules in a single send, then drain one framed response per
+            # module, collapsing N network round-trips to one; the lock keeps the transaction atomic
+            with self._io_unit.socket_lock:
+                if not self._io_unit.send_commands(self._ai_cmds):
+                    return data
+                responses = self._io_unit.recv_responses(len(self.system))
+            for m, prefix, rsp in zip(self.system, self._prefixes, responses):
+                # Decode data for all channels, return is {'Ch0': <value0>, 'Ch1': <value1>, ...}
+                module_data = m.decode_analog_input_all_channels(rsp)
+                if module_data is None:
+                    logger.warning(f"No data received from I/O module at slot {m.slot_idx}")
+                    continue
+                data.update((prefix + k, v) for k, v in module_data.items())
             return data
 
     class IcpdasDataOutput(DataSourceOutput.DataSourceOutputBase.SystemDataOutput):
@@ -34,7 +50,8 @@ class IcpdasDataSourceOutput(DataSourceOutput.DataSourceOutputBase):
             logger.info("Initializing IcpdasDataOutput ...")
             super().__init__(system, log_time_required=False)  # No requires of log time
             # Set variable names as 'Mo<slot index>Ch<channel index>'
-            self._all_variable_names = tuple(f'Mo{m.slot_idx}Ch{ch}' for m in self.system for ch in range(m.io_channel))
+            self._all_variable_names = tuple(
+                sys.intern(f'Mo{m.slot_idx}Ch{ch}') for m in self.system for ch in range(m.io_channel))
             # Generate a module map to facilitate data output
             self._module_map = {f'Mo{m.slot_idx}': m for m in self.system}
 
@@ -44,13 +61,12 @@ class IcpdasDataSourceOutput(DataSourceOutput.DataSourceOutputBase):
                 logger.debug("No keys available in data, skipping logging ...")
                 return
 
-            data_cleaned = self.clean_keys_with_none_values(data)  # Clean none values
-            if not data_cleaned:
-                logger.info("No more keys after cleaning the data, skipping logging ...")
-                return
-
-            # Loop to output data
+            # Loop to output data in a single pass that skips none values, instead of materializing a cleaned
+            # dict first; this also prevents none values from reaching the analog outputs
+            logged = 0
             for k, v in data.items():
+                if v is None:
+                    continue
                 # Match the module and channel index
                 match_res = re.search(pattern=r'Mo(\d+)Ch(\d+)', string=k)
                 if not match_res:
@@ -58,11 +74,15 @@ class IcpdasDataSourceOutput(DataSourceOutput.DataSourceOutputBase):
                     continue
 
                 mo, ch = match_res.groups()
-                module_key = f'Mo{mo}'
-                if module_key in self._module_map:
-                    self._module_map[module_key].output_analog_value_specified_channel(channel=int(ch), data=v)
+                # get() resolves the module with a single hash lookup instead of a membership check plus lookup
+                module = self._module_map.get(f'Mo{mo}')
+                if module is not None:
+                    module.output_analog_value_specified_channel(channel=int(ch), data=v)
+                    logged += 1
                 else:
-                    logger.warning(f"I/O module '{module_key}' is not available as output module")
+                    logger.warning(f"I/O module 'Mo{mo}' is not available as output module")
+            if logged == 0:
+                logger.info("No more keys after cleaning the data, skipping logging ...")
 
     def __init__(
             self,
@@ -71,7 +91,8 @@ class IcpdasDataSourceOutput(DataSourceOutput.DataSourceOutputBase):
             time_out: float = 0.5,
             io_series: str = 'I-87K',
             output_dir: str | None = None,
-            ignore_slots_idx: list[int] = None
+            ignore_slots_idx: list[int] = None,
+            analog_scale: int | None = None
     ):
         """
         Initialization of IcpdasDataSourceOutput
@@ -82,23 +103,26 @@ class IcpdasDataSourceOutput(DataSourceOutput.DataSourceOutputBase):
         :param io_series: I/O series name, the current version only supports 'I-87K'
         :param output_dir: Output directory to save initialization information
         :param ignore_slots_idx: List of slot indices to be ignored by reading or writing data
+        :param analog_scale: Optional fixed-point scale for analog inputs; channel values are returned as
+        int(round(value * scale)) instead of float, keeping downstream rows and publishes compact
 
         Default variable names are formatted as 'Mo<slot index>Ch<channel index>', with both indices starting from 0.
         """
         logger.info(f"Initializing IcpdasDataSourceOutput ...")
         self.host = host
         self.port = port
-        self.output_dir = output_dir
+        self.output_dir = pathlib.Path(output_dir) if output_dir is not None else None
         self.ignore_slots_idx = ignore_slots_idx
+        self.analog_scale = analog_scale
         self._all_configs = {}  # Configurations of I/O unit and all I/O modules
+        self._module_names = {}  # Module names by address id, filled during module initialization
 
         # Create output dir if it is not None
         if self.output_dir is None:
             logger.info(f"No output dir set, initialization information will not be saved")
         else:
             logger.info(f"Initialization information will be saved to: {self.output_dir}")
-            if not os.path.exists(self.output_dir):
-                os.makedirs(self.output_dir)
+            self.output_dir.mkdir(parents=True, exist_ok=True)  # Single call, no exists-then-create race
 
         # Init and connect I/O unit
         super().__init__()
@@ -123,7 +147,7 @@ class IcpdasDataSourceOutput(DataSourceOutput.DataSourceOutputBase):
 
         # Save configuration to file
         if self.output_dir is not None:
-            _file_path = os.path.join(self.output_dir, f'Config_{self.host}.json')
+            _file_path = self.output_dir / f'Config_{self.host}.json'
             logger.info(f"Saving configurations of unit with host {self.host} to: {_file_path} ...")
             Auxiliary.dump_json(self._all_configs, _file_path)
 
@@ -132,6 +156,7 @@ class IcpdasDataSourceOutput(DataSourceOutput.DataSourceOutputBase):
         modules = []
         if isinstance(self.io_unit, IoSeries_I87K.IoUnit):
             # Init for I/O modules of I/O series I-87K
+            module_map = IoSeries_I87K.IO_MODULE_MAP  # Bind once instead of resolving per slot
             for slot in range(self.io_unit.io_slot):
                 # Get the module name
                 address_id = slot + 2  # For ET-87PX series, the slot 0 has address ID of 2
@@ -141,10 +166,12 @@ class IcpdasDataSourceOutput(DataSourceOutput.DataSourceOutputBase):
                     continue  # Skip this slot
                 else:
                     module_name = module_name_rsp['module_name']
+                # Memorize the module name, so the configuration dump does not re-read it per module
+                self._module_names[address_id] = module_name
                 # Determine the class based on the module name
-                cls = IoSeries_I87K.IO_MODULE_MAP[module_name]['cls']
+                cls = module_map[module_name]['cls']
                 # Implement the class
-                module = cls(io_unit=self.io_unit, address_id=address_id)
+                module = cls(io_unit=self.io_unit, address_id=address_id, scale=self.analog_scale)
                 # Append module to the list
                 modules.append(module)
             return tuple(modules)
@@ -167,7 +194,7 @@ class IcpdasDataSourceOutput(DataSourceOutput.DataSourceOutputBase):
         config = {
             'address_id': io_module.address_id,
             'slot_idx': io_module.slot_idx,
-            'name': self.io_unit.read_module_name(io_module.address_id).get('module_name'),
+            'name': self._module_names.get(io_module.address_id),  # Already read during module initialization
             'io_type': io_module.io_type,
             'io_channel': io_module.io_channel,
             'firmware_version': self.io_unit.read_firmware_version(io_module.address_id).get('firmware_version'),
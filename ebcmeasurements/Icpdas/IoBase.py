@@ -4,11 +4,9 @@ Base module for ICP DAS
 Introduction of I/O modules: https://www.icpdas.com/root/product/solutions/remote_io/rs-485/i-8k_i-87k/i-8k_i-87k_introduction.html
 """
 from abc import ABC
-import re
 import socket
-import sys
-import logging.config
-# Load logging configuration from file
+import threading
+import logging
 logger = logging.getLogger(__name__)
 
 
@@ -27,6 +25,16 @@ class EthernetIoBase(ABC):
         '0A': 115200,
     }
 
+    # Class attribute: hex strings with 2 digits indexed by integer, so hot command paths do not format
+    _HEX2 = tuple(format(i, '02X') for i in range(256))
+
+    # Class attribute: per-key decode dispatch for 'decode_response', mapping parse key to output key and
+    # converter; a single dict lookup per key replaces the branch chain in the decode loop
+    _key_handlers = {
+        'address_id': ('address_id', lambda s: int(s, 16)),  # Decode hex address id to int
+        'baud_rate_code': ('baud_rate', _baud_rate_settings.get),  # Decode baud rate code to baud rate
+    }
+
     @staticmethod
     def _to_hex(value: int) -> str:
         """Converts an integer (dec) to hex with 2 digits"""
@@ -42,32 +50,29 @@ class EthernetIoBase(ABC):
     ) -> dict[str, str | float | int] | None:
         """
         Decode the response by parse
-        :param response: Response in utf-8 format
-        :param parse: Parse dict, with the format {'key1': (start_index, stop_index), ...}
+        :param response: Response in latin-1 format
+        :param parse: Parse dict, with the format {'key1': (start_index, end_index_exclusive), ...}; the
+        indices are used as a slice directly, so no per-key arithmetic happens in the decode loop
         :return: Dict of decoded keys and values
         """
-        def _decode_general(rsp: str, par: dict[str, tuple[int, int]]):
-            """General response decoder"""
-            decoded_response = {}
-            for key, (index_start, index_stop) in par.items():
-                if key == 'address_id':
-                    # Decode hex address id to int
-                    decoded_response[key] = int(rsp[index_start: index_stop + 1], 16)
-                elif key == 'baud_rate_code':
-                    # Decode baud rate code to baud rate
-                    decoded_response['baud_rate'] = EthernetIoBase._baud_rate_settings.get(rsp[index_start: index_stop + 1])
-                else:
-                    decoded_response[key] = rsp[index_start: index_stop + 1]
-            return decoded_response
-
         if not response:
             # No response due to time out
             logger.info(f"No data received due to time out or error")
             return None
-        elif response.startswith(('!', '>')):
-            # Valid response
-            return _decode_general(rsp=response, par=parse)
-        elif response.startswith('?'):
+        first_char = response[0]
+        if first_char in '!><':
+            # Valid response: decode each key via the precomputed handler dispatch
+            decoded_response = {}
+            handlers = EthernetIoBase._key_handlers
+            for key, (index_start, index_end) in parse.items():
+                handler = handlers.get(key)
+                if handler is None:
+                    decoded_response[key] = response[index_start: index_end]
+                else:
+                    out_key, convert = handler
+                    decoded_response[out_key] = convert(response[index_start: index_end])
+            return decoded_response
+        elif first_char == '?':
             # Invalid response
             address_id = int(response[1:3], 16)
             logger.info(f"Invalid response received by address-id '{address_id}': '{response}'")
@@ -79,36 +84,169 @@ class EthernetIoBase(ABC):
 
 class EthernetIoUnit(EthernetIoBase, ABC):
     """Base class for I/O expansion unit"""
+    # Scatter-gather writes are not available on all platforms (e.g. Windows)
+    _has_sendmsg = hasattr(socket.socket, 'sendmsg')
+
     def __init__(self, host: str, port: int, time_out: float):
         self.host = host
         self.port = port
         self.time_out = time_out
+        # Re-entrant lock guarding the socket; callers pipelining several commands hold it across the whole
+        # send/drain transaction, so concurrent users cannot interleave frames
+        self.socket_lock = threading.RLock()
+        # Persistent receive buffer: bytes after a frame terminator stay here for the next read, and each
+        # read drains the socket in large chunks instead of many small receives
+        self._rxbuf = bytearray()
+        # Preallocated scratch buffer for 'recv_into', so receiving allocates no bytes object per chunk
+        self._recv_scratch = bytearray(4096)
+        self._recv_view = memoryview(self._recv_scratch)
         self.socket = self._establish_socket_connection()
         logger.info(f"Socket connection established: {self.socket}")
 
+    def __del__(self):
+        """Destructor to ensure the socket connection is closed"""
+        self.close_socket_connection()
+
     def _establish_socket_connection(self) -> socket.socket:
         """Establish socket connection to I/O"""
         logger.info(f"Establishing socket connection to {self.host}:{self.port} ...")
         try:
-            return socket.create_connection(address=(self.host, self.port), timeout=self.time_out)
+            sock = socket.create_connection(address=(self.host, self.port), timeout=self.time_out)
+            # DCON exchanges tiny command and response frames; disable Nagle coalescing, so each command is
+            # transmitted immediately instead of waiting for a previous ACK
+            sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+            if hasattr(socket, 'TCP_QUICKACK'):
+                # Linux only: acknowledge immediately as well, so the unit does not wait for a delayed ACK
+                sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_QUICKACK, 1)
+            return sock
         except TimeoutError as e:
+            # Raise instead of exiting the process, so a caller probing multiple units can catch the failure
+            # of one unit and keep scanning the others
             logger.error(f"Socket connection error: {e}")
-            sys.exit(1)
+            raise ConnectionError(f"Connection to I/O unit {self.host}:{self.port} timed out") from e
+
+    def _reconnect(self):
+        """Re-establish the socket connection after a connection error"""
+        logger.info(f"Reconnecting to {self.host}:{self.port} ...")
+        try:
+            self.socket.close()
+        except OSError:
+            pass  # The stale socket may already be unusable
+        self._rxbuf.clear()  # Drop stale bytes of the old connection
+        self.socket = self._establish_socket_connection()
 
-    def get_response_by_command(self, command: str, buffer_size: int = 1024) -> str:
-        """Get response by writing a command"""
-        # Send the command as request
+    def close_socket_connection(self):
+        """Close the socket connection"""
+        if getattr(self, 'socket', None) is not None:
+            logger.info(f"Closing socket connection to {self.host}:{self.port} ...")
+            self.socket.close()
+            self.socket = None
+
+    def _sendall_with_reconnect(self, payload: bytes) -> bool:
+        """Send payload on the kept-alive socket, reconnecting once on a stale or half-closed connection"""
         try:
-            self.socket.sendall(command.encode('utf-8'))
-        except (TimeoutError, UnicodeError) as e:
+            self.socket.sendall(payload)
+        except TimeoutError as e:
             logger.error(e)
+            return False
+        except OSError:
+            # Stale connection (e.g. reset by the unit after idling): reconnect once and retry the send
+            self._reconnect()
+            try:
+                self.socket.sendall(payload)
+            except OSError as e:
+                logger.error(e)
+                return False
+        return True
+
+    def get_response_by_command(self, command: str | bytes, buffer_size: int = 1024) -> str:
+        """Get response by writing a command, pre-encoded commands are sent without any encoding work"""
+        # Send the command as request; DCON frames are pure ASCII, so 'latin-1' (a 1:1 byte map without the
+        # validation pass of utf-8) is sufficient and cannot raise on decoding
+        with self.socket_lock:
+            return self._get_response_by_command_locked(command, buffer_size)
+
+    def _get_response_by_command_locked(self, command: str | bytes, buffer_size: int) -> str:
+        """Request/response exchange; the caller holds the socket lock"""
+        payload = command if isinstance(command, bytes) else command.encode('latin-1')
+        if not self._sendall_with_reconnect(payload):
             return ''
-        # Receiving data
+        return self._readline_cr(buffer_size)
+
+    def _readline_cr(self, buffer_size: int = 1024) -> str:
+        """
+        Return the next '\\r'-terminated frame from the persistent receive buffer
+
+        TCP is a stream, so the socket is drained in large chunks into 'self._rxbuf' until the protocol
+        terminator arrives; bytes after the terminator stay buffered for the next frame. The terminator is
+        kept in the returned string, as the parsers index relative to it.
+        """
+        rxbuf = self._rxbuf
+        index_terminator = rxbuf.find(b'\r')
         try:
-            return self.socket.recv(buffer_size).decode('utf-8')
-        except (TimeoutError, UnicodeError) as e:
+            while index_terminator == -1:
+                n_received = self.socket.recv_into(self._recv_scratch)
+                if not n_received:
+                    # Connection closed by the peer
+                    break
+                rxbuf.extend(self._recv_view[:n_received])
+                index_terminator = rxbuf.find(b'\r')
+                if index_terminator == -1 and len(rxbuf) >= buffer_size:
+                    logger.warning(f"Response exceeds buffer size {buffer_size} without terminator")
+                    break
+        except TimeoutError as e:
             logger.error(e)
+            rxbuf.clear()  # Drop the partial frame, so the next exchange starts aligned
             return ''
+        if index_terminator == -1:
+            # No terminator received, return and clear whatever arrived
+            frame = rxbuf.decode('latin-1')
+            rxbuf.clear()
+            return frame
+        frame = rxbuf[: index_terminator + 1].decode('latin-1')
+        del rxbuf[: index_terminator + 1]
+        return frame
+
+    def send_commands(self, commands: tuple[bytes, ...] | list[bytes]) -> bool:
+        """
+        Send several pre-encoded commands back-to-back in a single socket write (pipelining)
+        :param commands: Commands to be sent as bytes
+        :return: True if the write succeeded, otherwise False
+
+        Callers should hold 'socket_lock' across the whole send/drain transaction.
+        """
+        if self._has_sendmsg:
+            # Scatter-gather write: one syscall without joining the command buffers first
+            try:
+                sent = self.socket.sendmsg(commands)
+                total = sum(len(command) for command in commands)
+                if sent < total:
+                    # Rare partial write, push the remainder with sendall
+                    self.socket.sendall(b''.join(commands)[sent:])
+                return True
+            except TimeoutError as e:
+                logger.error(e)
+                return False
+            except OSError:
+                pass  # Stale connection, fall through to the reconnecting bulk path
+        return self._sendall_with_reconnect(b''.join(commands))
+
+    def recv_responses(self, n: int, buffer_size: int = 1024) -> list[str]:
+        """
+        Drain n terminator-framed responses of previously pipelined commands
+        :param n: Number of expected responses
+        :param buffer_size: Maximum accumulated bytes per response without terminator
+        :return: List of n responses in command order, missing responses are empty strings
+        """
+        responses = []
+        for _ in range(n):
+            frame = self._readline_cr(buffer_size)
+            if not frame:
+                break  # Timed out or connection closed, remaining responses will not arrive
+            responses.append(frame)
+        # Pad missing responses, so callers can zip responses back to their commands
+        responses.extend([''] * (n - len(responses)))
+        return responses
 
 
 class EthernetIoModule(EthernetIoBase, ABC):
@@ -118,6 +256,12 @@ class EthernetIoModule(EthernetIoBase, ABC):
         self.address_id = address_id  # Address ID of the I/O module
         self.slot_idx = slot_idx  # Slot index of the I/O module
 
+        # Pre-built and pre-encoded commands for this address id, so the poll paths send without any
+        # formatting or encoding work
+        self._address_hex = self._HEX2[address_id]
+        self._cfg_cmd = f"${self._address_hex}2\r".encode('latin-1')
+        self._ai_all_cmd = f"#{self._address_hex}\r".encode('latin-1')
+
         # The following attributes must be configured in child class
         self._type_code_settings = None  # Dict for type code settings of the I/O module
         self._io_type = None  # I/O type of the I/O module, e.g. 'DI', 'DO', 'AI', 'AO'
@@ -125,12 +269,11 @@ class EthernetIoModule(EthernetIoBase, ABC):
 
     def read_configuration_status(self) -> dict[str, str] | None:
         """$AA2: Read module configuration"""
-        cmd = f"${self._to_hex(self.address_id)}2\r"
-        rsp = self.io_unit.get_response_by_command(cmd)
+        rsp = self.io_unit.get_response_by_command(self._cfg_cmd)
         # Get decoded response
         dec_rsp = self.decode_response(
             response=rsp,
-            parse={'address_id': (1, 2), 'type_code': (3, 4), 'baud_rate_code': (5, 6), 'format_code': (7, 8)}
+            parse={'address_id': (1, 3), 'type_code': (3, 5), 'baud_rate_code': (5, 7), 'format_code': (7, 9)}
         )
         # Process decoded response
         if dec_rsp is not None:
@@ -142,45 +285,84 @@ class EthernetIoModule(EthernetIoBase, ABC):
 
     def read_analog_input_all_channels(self) -> dict[str, str | float | int]:
         """#AA: Read analog/counter inputs of all channels"""
-        cmd = f"#{self._to_hex(self.address_id)}\r"
-        rsp = self.io_unit.get_response_by_command(cmd)
+        rsp = self.io_unit.get_response_by_command(self._ai_all_cmd)
+        return self.decode_analog_input_all_channels(rsp)
+
+    def decode_analog_input_all_channels(self, response: str) -> dict[str, str | float | int] | None:
+        """
+        Decode a response of the '#AA' all-channels read command
+
+        Split from 'read_analog_input_all_channels', so batched callers that pipeline the commands of several
+        modules can decode each drained response separately; overridden by module classes to split the data
+        string into channel values.
+        """
         return self.decode_response(
-            response=rsp,
-            parse={'data': (1, -2)},
+            response=response,
+            parse={'data': (1, -1)},
         )
 
     def read_analog_input_specified_channel(self, channel: int) -> dict[str, str | float | int]:
         """#AAN: Read analog/counter input of specified channel"""
-        cmd = f"#{self._to_hex(self.address_id)}{channel}\r"
+        cmd = f"#{self._address_hex}{channel}\r"
         rsp = self.io_unit.get_response_by_command(cmd)
         return self.decode_response(
             response=rsp,
-            parse={'data': (1, -2)},
+            parse={'data': (1, -1)},
         )
 
     def output_analog_value_specified_channel(self, channel: int, data: float) -> bool:
         """#AAN(Data): Output analog value of specified channel"""
         formatted_data = str("{:+06.3f}".format(data))
-        cmd = f"#{self._to_hex(self.address_id)}{channel}{formatted_data}\r"
+        cmd = f"#{self._address_hex}{channel}{formatted_data}\r"
         rsp = self.io_unit.get_response_by_command(cmd)
         return rsp == '>\r'
 
     @staticmethod
-    def _split_data_string_to_values(data_string: str, none_value: str = None) -> dict[str, float | None]:
+    def _split_data_string_to_values(
+            data_string: str,
+            none_value: str = None,
+            scale: int = None,
+    ) -> dict[str, float | int | None]:
         """
         Split data string to dict of channel numbers and values by using regular expression
 
         :param data_string: Data to be split in string format
         :param none_value: Value that must be converted to None, if None, all values are converted to float
+        :param scale: Optional fixed-point scale; values are returned as int(round(value * scale)), so
+        downstream sinks carry compact integers instead of boxed floats
         """
-        # Split the string with lookahead assertion, drop the first empty element
-        str_values = re.split(pattern='(?=[+-])', string=data_string)[1:]
+        # Fixed-width fast path: DCON analog data formats every value with the same width, so once the second
+        # sign position is known the string can be sliced in fixed steps without visiting each character
+        length = len(data_string)
+        width = 0
+        for i in range(1, length):
+            c = data_string[i]
+            if c == '+' or c == '-':
+                width = i
+                break
+        if width and length % width == 0:
+            str_values = [data_string[i: i + width] for i in range(0, length, width)]
+        else:
+            # Fallback scan for irregular widths: every value starts with its sign character, so one pass
+            # over the string collecting the sign positions splits the values
+            str_values = []
+            start = -1
+            for i, c in enumerate(data_string):
+                if c == '+' or c == '-':
+                    if start >= 0:
+                        str_values.append(data_string[start:i])
+                    start = i
+            if start >= 0:
+                str_values.append(data_string[start:])
         if none_value is None:
             # Convert all values to float
             values = [float(v) for v in str_values]
         else:
             # Convert all values to float except none_value
             values = [float(v) if v != none_value else None for v in str_values]
+        if scale is not None:
+            # Quantize to fixed-point integers
+            values = [int(round(v * scale)) if v is not None else None for v in values]
         # Return a dict with channel keys and values
         return {f'Ch{ch}': v for ch, v in enumerate(values)}
 
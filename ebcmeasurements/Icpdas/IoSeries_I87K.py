@@ -25,7 +25,7 @@ class IoUnit(IoBase.EthernetIoUnit):
         rsp = self.get_response_by_command(cmd)
         return self.decode_response(
             response=rsp,
-            parse={'address_id': (1, 2), 'firmware_version': (3, -2)}
+            parse={'address_id': (1, 3), 'firmware_version': (3, -1)}
         )
 
     def read_module_name(self, address_id: int) -> dict[str, int | str]:
@@ -34,7 +34,7 @@ class IoUnit(IoBase.EthernetIoUnit):
         rsp = self.get_response_by_command(cmd)
         return self.decode_response(
             response=rsp,
-            parse={'address_id': (1, 2), 'module_name': (3, -2)}
+            parse={'address_id': (1, 3), 'module_name': (3, -1)}
         )
 
     @property
@@ -45,9 +45,14 @@ class IoUnit(IoBase.EthernetIoUnit):
 
 class IoModule87013W(IoBase.EthernetIoModule):
     """4-Channel RTD Analog Input Module"""
-    def __init__(self, io_unit: IoUnit, address_id: int):
+    def __init__(self, io_unit: IoUnit, address_id: int, scale: int = None):
+        """
+        :param scale: Optional fixed-point scale; channel values are returned as int(round(value * scale))
+        instead of float
+        """
         # For ET-87PX series, the slot 0 has address ID of 2
         super().__init__(io_unit, address_id, slot_idx=address_id - 2)
+        self._scale = scale
         self._type_code_settings = {
             '20': 'Platinum 100, a = 0.00385, -100 to 100 degC (default)',
             '21': 'Platinum 100, a = 0.00385, 0 to 100 degC',
@@ -68,18 +73,23 @@ class IoModule87013W(IoBase.EthernetIoModule):
         self._io_type = 'AI'  # Analog input
         self._io_channel = 4  # 4 channels
 
-    def read_analog_input_all_channels(self) -> dict[str, float | None]:
-        """#AA: Read analog/counter inputs of all channels"""
-        dec_rsp = super().read_analog_input_all_channels()  # Get the decoded response
+    def decode_analog_input_all_channels(self, response: str) -> dict[str, float | int | None] | None:
+        """Decode a response of the '#AA' all-channels read command into channel values"""
+        dec_rsp = super().decode_analog_input_all_channels(response)  # Get the decoded response
         return self._split_data_string_to_values(
-            dec_rsp.pop('data'), none_value='-0000') if dec_rsp is not None else None
+            dec_rsp.pop('data'), none_value='-0000', scale=self._scale) if dec_rsp is not None else None
 
 
 class IoModule87019RW(IoBase.EthernetIoModule):
     """8-channel Universal Analog Input Module with High Overvoltage Protection"""
-    def __init__(self, io_unit: IoUnit, address_id: int):
+    def __init__(self, io_unit: IoUnit, address_id: int, scale: int = None):
+        """
+        :param scale: Optional fixed-point scale; channel values are returned as int(round(value * scale))
+        instead of float
+        """
         # For ET-87PX series, the slot 0 has address ID of 2
         super().__init__(io_unit, address_id, slot_idx=address_id - 2)
+        self._scale = scale
         self._type_code_settings = {
             '00': '-15mV to +15mV',
             '01': '-50mV to +50mV',
@@ -110,10 +120,11 @@ class IoModule87019RW(IoBase.EthernetIoModule):
         self._io_type = 'AI'  # Analog input
         self._io_channel = 8  # 8 channels
 
-    def read_analog_input_all_channels(self) -> dict[str, float | None]:
-        """#AA: Read analog/counter inputs of all channels"""
-        dec_rsp = super().read_analog_input_all_channels()  # Get the decoded response
-        return self._split_data_string_to_values(dec_rsp.pop('data')) if dec_rsp is not None else None
+    def decode_analog_input_all_channels(self, response: str) -> dict[str, float | int | None] | None:
+        """Decode a response of the '#AA' all-channels read command into channel values"""
+        dec_rsp = super().decode_analog_input_all_channels(response)  # Get the decoded response
+        return self._split_data_string_to_values(
+            dec_rsp.pop('data'), scale=self._scale) if dec_rsp is not None else None
 
 
 # I/O module map <name by request>: <class of I/O module>
@@ -2,12 +2,13 @@
 Module MqttDataSourceOutput: Interface of MQTT client to DataLogger
 """
 from ebcmeasurements.Base import DataOutput, DataSourceOutput, DataLogger
+import collections
 import paho.mqtt.client as mqtt
+import socket
 import threading
 import time
 import sys
-import logging.config
-# Load logging configuration from file
+import logging
 logger = logging.getLogger(__name__)
 
 
@@ -32,20 +33,36 @@ class MqttDataSourceOutput(DataSourceOutput.DataSourceOutputBase):
             logger.info("Initializing MqttDataSource ...")
             super().__init__(system)
             self._all_topics = all_topics
-            self._all_variable_names = all_variable_names if all_variable_names is not None else all_topics
+            # Interned names let dict lookups in the logging hot path succeed on pointer identity
+            self._all_variable_names = tuple(
+                map(sys.intern, all_variable_names if all_variable_names is not None else all_topics))
             self._data_buffer = {}
+            # Lock guarding the data buffer against the 'on_message' callback on the paho network thread
+            self._data_buffer_lock = threading.Lock()
+            # Pre-built (topic, qos) subscribe list, reused on every connect and reconnect
+            self._topics_qos = [(topic, 0) for topic in self._all_topics]
+            # Pre-built topic-to-variable-name map, so 'on_message' resolves the buffer key with one dict get
+            # instead of walking any mapping; with custom variable names this also keys the buffer by the
+            # variable name the logger expects rather than by the raw topic. Falls back to identity if the
+            # names do not align one-to-one with the topics (payloads carrying multiple values)
+            if len(self._all_variable_names) == len(self._all_topics):
+                self._topic_to_name = dict(zip(self._all_topics, self._all_variable_names))
+            else:
+                self._topic_to_name = {}
 
         def mqtt_subscribe(self):
-            qos = 0
-            self.system.subscribe(list(zip(self._all_topics, [qos] * len(self._all_variable_names))))
+            self.system.subscribe(self._topics_qos)
 
         def synchronize_data_buffer(self, data: dict[str, float]):
-            self._data_buffer.update(data)
+            with self._data_buffer_lock:
+                self._data_buffer.update(data)
 
         def read_data(self) -> dict:
             """Execute by DataLoggerTimeTrigger, read data from buffer updated in the last period and clean"""
-            data = self._data_buffer.copy()  # Copy the current data buffer
-            self._data_buffer.clear()  # Clear the data buffer
+            # Swap the buffer against a fresh dict instead of copy-and-clear: one allocation, no O(N) copy,
+            # and atomic against the MQTT callback thread
+            with self._data_buffer_lock:
+                data, self._data_buffer = self._data_buffer, {}
             return data
 
     class MqttDataOutput(DataSourceOutput.DataSourceOutputBase.SystemDataOutput):
@@ -68,23 +85,27 @@ class MqttDataSourceOutput(DataSourceOutput.DataSourceOutputBase):
             logger.info("Initializing MqttDataOutput ...")
             super().__init__(system, log_time_required=False)  # No requires of log time
             self._all_topics = all_topics
-            self._all_variable_names = all_variable_names if all_variable_names is not None else all_topics
+            self._all_variable_names = tuple(
+                map(sys.intern, all_variable_names if all_variable_names is not None else all_topics))
 
         def log_data(self, data: dict):
             if not data:
                 logger.debug("No keys available in data, skipping logging ...")
                 return
 
-            data_cleaned = self.clean_keys_with_none_values(data)  # Clean none values
-            if not data_cleaned:
-                logger.info("No more keys after cleaning the data, skipping logging ...")
+            if not self.system.is_connected():
+                logger.warning("Unable to publish the data due to disconnection")
                 return
 
-            if self.system.is_connected():
-                for topic, value in data_cleaned.items():
-                    self.system.publish(topic, value)
-            else:
-                logger.warning("Unable to publish the data due to disconnection")
+            # Publish in a single pass that skips none values, instead of materializing a cleaned dict first
+            published = 0
+            publish = self.system.publish
+            for topic, value in data.items():
+                if value is not None:
+                    publish(topic, value)
+                    published += 1
+            if published == 0:
+                logger.info("No more keys after cleaning the data, skipping logging ...")
 
     class MqttDataOnMsgLogger(DataLogger.DataLoggerBase):
         """MQTT implementation of nested class MqttDataOnMsgLogger, triggerd by 'on_message'"""
@@ -94,10 +115,22 @@ class MqttDataSourceOutput(DataSourceOutput.DataSourceOutputBase):
                 data_outputs_mapping: dict[str: DataOutput.DataOutputBase],
                 data_type_conversion_mapping: dict[str, dict[str, str]] | None = None,
                 data_rename_mapping: dict[str, dict[str, str]] | None = None,
+                progress_every: int = 100,
+                queue_maxlen: int = 10000,
+                drain_interval: float = 0.1,
         ):
-            """MQTT 'on message' triggerd data logger"""
+            """MQTT 'on message' triggerd data logger
+
+            :param progress_every: Print the logging count to console only every given number of messages, so that
+                high message rates do not spend a console write per message
+            :param queue_maxlen: Maximum number of received messages held in the internal queue, bounding memory
+                under bursts; once full, the oldest messages are dropped
+            :param drain_interval: Period in seconds with which queued messages are drained and logged in batches
+            """
             logger.info("Initializing MqttDataOnMsgLogger ...")
             self.data_source_name = str(hex(id(data_source)))  # Get ID as data source name
+            self.progress_every = progress_every
+            self._print_fmt = f"MQTTOnMsgTrigger - {hex(id(self))} - Logging count(s): %d\n"
             super().__init__(
                 data_sources_mapping={self.data_source_name: data_source},
                 data_outputs_mapping=data_outputs_mapping,
@@ -106,17 +139,64 @@ class MqttDataSourceOutput(DataSourceOutput.DataSourceOutputBase):
                 data_rename_mapping=
                 {self.data_source_name: data_rename_mapping} if data_rename_mapping is not None else None
             )
+            # Received messages are only appended to this bounded deque on the MQTT network thread; a background
+            # thread drains them periodically in batches, so row building and output dispatch never delay message
+            # reception, and bursty topics are logged in one go instead of one full logging pass per message
+            self._rx_queue = collections.deque(maxlen=queue_maxlen)
+            self._drain_interval = drain_interval
+            self._drain_stop_event = threading.Event()
+            self._drain_thread = threading.Thread(
+                target=self._drain_loop, name=f'MqttOnMsgDrain-{hex(id(self))}', daemon=True)
+            self._drain_thread.start()
+
+        def stop(self):
+            """Stop the drain thread after logging all queued messages and persist all logged data
+
+            The drain thread holds a reference to this logger, so without an explicit stop the logger and its
+            data outputs would stay alive for the whole process lifetime.
+            """
+            self._drain_stop_event.set()
+            if self._drain_thread.is_alive():
+                self._drain_thread.join()
+            # Mirror the end-of-run guarantee of the time-triggered logger: drain the pending data in the
+            # writer queues, then flush every output that buffers rows, so no logged message is lost when the
+            # process exits right after stopping
+            self.stop_writer_threads()
+            for do in self._data_outputs:
+                flush = getattr(do, 'flush', None)
+                if flush is not None:
+                    flush()
 
         def run_data_logging(self, data):
-            # Logging data
-            timestamp = self.get_timestamp_now()  # Get timestamp
-
-            # Log count
-            self.log_count += 1  # Update log counter
-            print(f"MQTTOnMsgTrigger - {hex(id(self))} - Logging count(s): {self.log_count}")  # Print count to console
+            """Queue received data for logging, executed on the MQTT network thread
 
-            # Log data to each output
-            self.log_data_all_outputs({self.data_source_name: data}, timestamp)
+            The timestamp is taken at reception, so the logged time reflects the message arrival and not the
+            drain period.
+            """
+            self._rx_queue.append((self.get_timestamp_now(), data))
+
+        def _drain_loop(self):
+            """Periodically drain and log all queued messages until 'stop' is requested"""
+            stop_event = self._drain_stop_event
+            while not stop_event.wait(self._drain_interval):
+                self._drain()
+            self._drain()  # Final drain, so messages queued up to the stop request are still logged
+
+        def _drain(self):
+            """Log all currently queued messages, one row per message"""
+            rx_queue = self._rx_queue
+            ds_name = self.data_source_name
+            log_data_all_outputs = self.log_data_all_outputs
+            while rx_queue:
+                timestamp, data = rx_queue.popleft()
+
+                # Log count
+                self.log_count += 1  # Update log counter
+                if self.log_count % self.progress_every == 0:
+                    sys.stderr.write(self._print_fmt % self.log_count)  # Print count to console
+
+                # Log data to each output
+                log_data_all_outputs({ds_name: data}, timestamp)
 
     def __init__(
             self,
@@ -236,14 +316,23 @@ class MqttDataSourceOutput(DataSourceOutput.DataSourceOutputBase):
         self.system.loop_forever()
 
     def mqtt_stop(self):
-        """Stop the network loop and disconnect the broker"""
+        """Stop the network loop and disconnect the broker, stopping the on-message data logger if activated"""
         logger.info("Stopping network loop and disconnecting ...")
+        on_msg_data_logger = getattr(self, '_on_msg_data_logger', None)  # May not exist if initialization failed
+        if on_msg_data_logger is not None:
+            on_msg_data_logger.stop()
         self.system.loop_stop()
         self.system.disconnect()
 
     def on_connect(self, client, userdata, flags, rc):
         if rc == 0:
             logger.info(f"Connected to {self.broker} with result code {rc}")
+            # Publishes are tiny frames; disable Nagle coalescing on the broker socket, so each message is
+            # transmitted immediately instead of waiting for a previous ACK
+            try:
+                client.socket().setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+            except (OSError, AttributeError) as e:
+                logger.debug(f"Unable to set TCP_NODELAY on the broker socket: {e}")
             # Subscribe to multiple topics for data source
             if self._data_source is not None:
                 self._data_source.mqtt_subscribe()
@@ -253,16 +342,26 @@ class MqttDataSourceOutput(DataSourceOutput.DataSourceOutputBase):
 
     def on_message(self, client, userdata, msg):
         topic = msg.topic
-        payload = msg.payload.decode("utf-8")
-        logger.debug(f"Received message '{payload}' on topic '{topic}' with QoS {msg.qos}")
-        data = {topic: float(payload)}
+        # Lazy %-style logging: the message is only formatted when the debug level is enabled
+        logger.debug("Received message '%s' on topic '%s' with QoS %s", msg.payload, topic, msg.qos)
+        try:
+            # float() parses ASCII bytes directly, skipping a utf-8 decode pass per message
+            value = float(msg.payload)
+        except ValueError:
+            # A malformed payload must not crash the paho network thread
+            logger.warning("Non-numeric payload %r received on topic '%s', skipping ...", msg.payload, topic)
+            return
         if self._data_source is not None:
+            # Key the data by the variable name resolved from the topic with a single dict get
+            data = {self._data_source._topic_to_name.get(topic, topic): value}
             self._data_source.synchronize_data_buffer(data)  # Synchronize data buffer of data source
+        else:
+            data = {topic: value}
         if self._on_msg_data_logger is not None:
             self._on_msg_data_logger.run_data_logging(data)  # Trigger MQTT data logger
 
     def on_publish(self, client, userdata, mid):
-        logger.debug(f"Message published with mid: {mid}")
+        logger.debug("Message published with mid: %s", mid)
 
     def on_disconnect(self, client, userdata, rc):
         logger.info(f"Disconnected from the broker {rc}")
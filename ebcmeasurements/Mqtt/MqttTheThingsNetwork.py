@@ -6,10 +6,21 @@ What is the MQTT server of TheThingsNetwork (TTN):
 """
 from ebcmeasurements.Mqtt import MqttDataSourceOutput
 import json
-import logging.config
-# Load logging configuration from file
+import sys
+import logging
 logger = logging.getLogger(__name__)
 
+try:
+    # orjson parses JSON with a C extension several times faster than the stdlib, the uplink parse is the
+    # per-message hot path; it is an optional dependency, the stdlib parser is the fallback
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:
+    _json_loads = json.loads  # Accepts bytes directly as well, no separate decode pass needed
+
+# Sentinel to distinguish a variable missing from the decoded payload from an explicit null value
+_MISSING = object()
+
 
 class MqttTheThingsNetwork(MqttDataSourceOutput.MqttDataSourceOutput):
     class MqttDataOutput(MqttDataSourceOutput.MqttDataSourceOutput.MqttDataOutput):
@@ -105,6 +116,14 @@ class MqttTheThingsNetwork(MqttDataSourceOutput.MqttDataSourceOutput):
             else:
                 self._down_pld_var_names[device_id] = device_downlink_payload_variable_names[device_id]
 
+        # Per-device tuples of (buffer key, payload variable name), resolved once so the uplink handler pulls
+        # only the requested variables out of the decoded payload instead of rebuilding and filtering full dicts
+        # per message; names are interned like the variable names they must match
+        self._wanted = {
+            device_id: tuple((sys.intern(f'{device_id}:{v}'), sys.intern(v)) for v in values)
+            for device_id, values in self._up_pld_var_names.items() if values is not None
+        }
+
         # Init the MQTT of parent class
         super().__init__(
             broker=broker,
@@ -124,27 +143,23 @@ class MqttTheThingsNetwork(MqttDataSourceOutput.MqttDataSourceOutput):
 
     def on_message(self, client, userdata, msg):
         topic = msg.topic
-        payload = json.loads(msg.payload.decode("utf-8"))
-        logger.debug(f"Received message '{payload}' on topic '{topic}' with QoS {msg.qos}")
-        unzipped_payload = self._unzip_payload(payload)  # Unzip payload
-        device_id = unzipped_payload['device_id']
-        if device_id is not None:
-            data = {
-                f'{device_id}:{var_name}': v
-                for var_name, v in unzipped_payload['decoded_payload'].items()
-                if f'{device_id}:{var_name}' in self.data_source.all_variable_names
-            }
-        else:
+        payload = _json_loads(msg.payload)  # Parse the payload bytes directly, without an utf-8 decode pass
+        logger.debug("Received message '%s' on topic '%s' with QoS %s", payload, topic, msg.qos)
+        device_id = payload.get('end_device_ids', {}).get('device_id', None)
+        if device_id is None:
             return
+        wanted = self._wanted.get(device_id)
+        if not wanted:
+            return  # No uplink variable names defined for this device
+        # Pull only the requested variables out of the decoded payload, instead of iterating the whole payload
+        # and filtering it against all variable names per message
+        decoded_payload = payload.get('uplink_message', {}).get('decoded_payload', {})
+        data = {}
+        for key, var_name in wanted:
+            value = decoded_payload.get(var_name, _MISSING)
+            if value is not _MISSING:
+                data[key] = value
         if self._data_source is not None:
             self._data_source.synchronize_data_buffer(data)  # Synchronize data buffer of data source
         if self._on_msg_data_logger is not None:
             self._on_msg_data_logger.run_data_logging(data)  # Trigger MQTT data logger
-
-    @staticmethod
-    def _unzip_payload(payload: dict) -> dict[str, str | dict | None]:
-        """Unzip device ID and payload from TTN upstream payload"""
-        return {
-            'device_id': payload.get('end_device_ids', {}).get('device_id', None),
-            'decoded_payload': payload.get('uplink_message', {}).get('decoded_payload', {})
-        }
@@ -3,14 +3,29 @@ Module SensoSysDataSource: Interface to DataLogger
 """
 
 from ebcmeasurements.Base import DataSource, Auxiliary
-from ebcmeasurements.Sensor_Electronic import SensoSysDevices
-from datetime import datetime
+import hashlib
 import os
+import re
 import sys
-import logging.config
-# Load logging configuration from file
+import logging
 logger = logging.getLogger(__name__)
 
+# Calibration expired date as reported by the devices: 'dd-mm-yy' or 'dd.mm.yy'
+_EXP_DATE_RE = re.compile(r'^(\d{2})[-.](\d{2})[-.](\d{2})$')
+
+# Deferred import of SensoSysDevices (it opens pyserial machinery), so importing this module stays cheap;
+# resolved by '_load_sensosys_devices' on first instantiation
+SensoSysDevices = None
+
+
+def _load_sensosys_devices():
+    """Import SensoSysDevices on first use and bind it to the module-level name"""
+    global SensoSysDevices
+    if SensoSysDevices is None:
+        from ebcmeasurements.Sensor_Electronic import SensoSysDevices as _SensoSysDevices
+        SensoSysDevices = _SensoSysDevices
+    return SensoSysDevices
+
 
 class SensoSysDataSource(DataSource.DataSourceBase):
     def __init__(
@@ -19,6 +34,7 @@ class SensoSysDataSource(DataSource.DataSourceBase):
             output_dir: str | None = None,
             all_devices_ids: list[int] | None = None,
             time_out: float = 0.1,
+            probe_time_out: float = 0.02,
     ):
         """
         Initialize SensoSysDataSource instance
@@ -26,23 +42,28 @@ class SensoSysDataSource(DataSource.DataSourceBase):
         :param output_dir: Output dir to save information of found devices, if None, they will not be saved
         :param all_devices_ids: All possible device's IDs to scan, if None, scan ID from 0 to 255
         :param time_out: Timeout in seconds for serial communication
+        :param probe_time_out: Reduced timeout in seconds used only while probing addresses during the device
+        scan; absent addresses each cost one timeout, so a full-range scan speeds up by about the ratio of the
+        two timeouts
 
         Default variable names are formatted as '<variable>_<address ID>'.
         """
         logger.info("Initializing SensoSysDataSource ...")
 
+        _load_sensosys_devices()  # Resolve the deferred SensoSysDevices import
         super().__init__()
         self.port = None
         self.output_dir = output_dir
         self.all_devices_ids = None
+        self.time_out = time_out
+        self.probe_time_out = probe_time_out
 
         # Create output dir if it is not None
         if self.output_dir is None:
             logger.info(f"No output dir set, initialization information will not be saved")
         else:
             logger.info(f"Initialization information will be saved to: {self.output_dir}")
-            if not os.path.exists(self.output_dir):
-                os.makedirs(self.output_dir)
+            os.makedirs(self.output_dir, exist_ok=True)
 
         # Scan available COM port(s)
         self.available_ports = self._scan_available_ports()
@@ -60,12 +81,14 @@ class SensoSysDataSource(DataSource.DataSourceBase):
         logger.info(f"Initializing SensoSysDevices ...")
         self.sensosys = SensoSysDevices.SensoSys(port=self.port, time_out=time_out)
 
-        # Scan devices
+        # Scan devices, reusing the cached scan result of a previous run if the setup is unchanged
         if all_devices_ids is None:
-            self.sensosys_devices = self._scan_devices(ids=list(range(0, 255)))  # Scan by id from 00 to FF
+            self.sensosys_devices = self._scan_devices_cached(ids=list(range(0, 255)))  # Scan id from 00 to FF
         else:
-            self.sensosys_devices = self._scan_devices(ids=all_devices_ids)  # Scan according to input
+            self.sensosys_devices = self._scan_devices_cached(ids=all_devices_ids)  # Scan according to input
         self.all_devices_ids = self.sensosys_devices.keys()
+        # Frozen set of found IDs as int for O(1) membership checks in downstream callers
+        self._known_ids: frozenset[int] = frozenset(int(k) for k in self.sensosys_devices)
         logger.info(f"Found SensoSys devices: \n"
                     f"{self.sensosys_devices} \n"
                     f"Number of found devices: {len(self.sensosys_devices)}")
@@ -93,6 +116,10 @@ class SensoSysDataSource(DataSource.DataSourceBase):
         # Set all_data_names
         self._all_variable_names = self._get_all_variable_names()
 
+        # Pre-built read plan: bound read functions and key tuples per device, so 'read_data' does not rebuild
+        # variable names or re-index sensor configurations on every poll
+        self._read_plan = self._build_read_plan()
+
     def _get_port_by_guide(self) -> str:
         """Get SensoSys configurations by a user guide"""
         logger.info("Configuring SensoSys by a user guide ...")
@@ -107,111 +134,168 @@ class SensoSysDataSource(DataSource.DataSourceBase):
         if self.port in self.available_ports:
             logger.info(f"Successfully set COM port to '{self.port}'")
         else:
-            logger.error(f"The COM port '{self.port}' is unavailable, exiting ...")
-            sys.exit(1)
+            # Raise instead of exiting the process, so a caller can catch the failure and keep running
+            raise ConnectionError(f"The COM port '{self.port}' is unavailable")
+
+    def _scan_devices_cached(self, ids: list[int]) -> dict[str, dict]:
+        """
+        Scan devices, reusing a cached scan result when the scan configuration is unchanged
+
+        The result of a full scan is cached in the output dir together with a hash of the scan configuration
+        (port and address IDs). On the next run with a matching hash, each cached device is verified with a
+        single probe (O(found) instead of O(scanned)); any mismatch falls back to the full scan. Without an
+        output dir the cache is disabled and the full scan always runs.
+        """
+        cache_path = None if self.output_dir is None else os.path.join(self.output_dir, '.found_devices_cache.json')
+        config_hash = hashlib.sha256(repr((self.port, sorted(ids))).encode()).hexdigest()
+        if cache_path is not None and os.path.isfile(cache_path):
+            try:
+                # Cached load: re-creating the data source in the same process skips re-parsing an unchanged file
+                cache = Auxiliary.load_json_cached(cache_path)
+            except (OSError, ValueError):
+                cache = None  # Unreadable or corrupted cache, rescan
+            if isinstance(cache, dict) and cache.get('config_hash') == config_hash:
+                devices = cache.get('devices', {})
+                if devices and len(self._probe_device_ids([int(k) for k in devices])) == len(devices):
+                    logger.info(f"Reusing {len(devices)} cached device(s) from: {cache_path}")
+                    return devices
+                logger.info("Cached devices could not be verified, rescanning ...")
+        devices = self._scan_devices(ids)
+        if cache_path is not None and devices:
+            # Atomic write via temporary file, so a concurrent reader never sees a partial cache
+            _tmp_path = f'{cache_path}.tmp'
+            Auxiliary.dump_json({'config_hash': config_hash, 'devices': devices}, _tmp_path)
+            os.replace(_tmp_path, cache_path)
+        return devices
 
     def _scan_devices(self, ids: list[int]) -> dict[str, dict]:
-        """Scan devices by ids"""
+        """
+        Scan devices by ids in two phases: probe all addresses, then read details of found devices only
+
+        All devices share one half-duplex RS-485 line, so probes cannot run in parallel; the split instead keeps
+        the cost per absent address down to a single request timeout, while the follow-up reads (serial number,
+        calibration, battery, configuration) are only issued for addresses that answered the probe.
+        """
         available_devices = {}
-        for _id in ids:
-            logger.info(f"Scanning address ID {_id} ...")
-            device_name_response = self.sensosys.read_instrument_name(_id)
-            if device_name_response is not None:
-                # Get and convert instrument name to upper case
-                device_name_response['instrument_name'] = device_name_response['instrument_name'].upper().strip()
-                instrument_name = device_name_response['instrument_name']
-                logger.info(
-                    f"Found device with ID '{_id}', instrument name '{instrument_name}'")
-
-                # Read common device information
-                device_responses = device_name_response  # Dict for all responses
-                device_responses.update(self.sensosys.read_serial_number(_id))  # Serial number
-                device_responses.update(self.sensosys.read_expired_calibration_date(_id))  # Calibration expired data
-                device_responses.update(self.sensosys.read_battery_state(_id))  # Battery state
-
-                # Read special device information
-                if instrument_name.startswith('ANEMO'):
-                    device_responses.update(self.sensosys.senso_anemo_read_configuration(_id))
-                    device_responses.update(self.sensosys.senso_anemo_read_indicator(_id))
-                elif instrument_name.startswith('THERM'):
-                    device_responses.update(self.sensosys.senso_therm_read_configuration(_id))
-                    for _ch in range(1, 5):
-                        device_responses.update({
-                            f'senso_therm_indicator_channel_{_ch}': self.sensosys.senso_therm_read_indicator(
-                                _id, _ch).get('senso_therm_indicator')
-                        })
-                elif instrument_name.startswith(('HYGRO', 'HIGRO')):
-                    device_responses.update(self.sensosys.senso_hygbar_read_configuration(_id))
-                else:
-                    raise ValueError(f"Invalid instrument name '{instrument_name}'")
-
-                # Convert calibration expired date format
-                exp_date = device_responses.get('calibration_expired_date')
-                date_formats = ['%d-%m-%y', '%d.%m.%y']
-                if exp_date is not None:
-                    for _fmt in date_formats:
-                        try:
-                            device_responses['calibration_expired_date'] = datetime.strptime(
-                                exp_date, _fmt).strftime('%Y-%m-%d')
-                            break  # Exit the loop once the date is successfully parsed
-                        except ValueError:
-                            continue  # If parsing fails, continue to the next format
-
-                # Update available devices
-                available_devices.update({str(_id): device_responses})
+        for _id, device_name_response in self._probe_device_ids(ids):
+            available_devices[str(_id)] = self._read_device_details(_id, device_name_response)
         return available_devices
 
+    def _probe_device_ids(self, ids: list[int]) -> list[tuple[int, dict]]:
+        """Probe phase: one instrument name request per address, collecting the responding devices"""
+        found = []
+        # Probe with the reduced timeout: present devices answer well within it, and each absent address then
+        # only blocks for the short probe timeout instead of the full communication timeout
+        self.sensosys.set_time_out(self.probe_time_out)
+        try:
+            for _id in ids:
+                logger.info(f"Scanning address ID {_id} ...")
+                device_name_response = self.sensosys.read_instrument_name(_id)
+                if device_name_response is not None:
+                    # Get and convert instrument name to upper case
+                    device_name_response['instrument_name'] = device_name_response['instrument_name'].upper().strip()
+                    logger.info(
+                        f"Found device with ID '{_id}', instrument name "
+                        f"'{device_name_response['instrument_name']}'")
+                    found.append((_id, device_name_response))
+        finally:
+            # Restore the normal timeout before the detail reads
+            self.sensosys.set_time_out(self.time_out)
+        return found
+
+    def _read_device_details(self, _id: int, device_name_response: dict) -> dict:
+        """Detail phase: read common and device-specific information of one found device"""
+        instrument_name = device_name_response['instrument_name']
+
+        # Read common device information
+        device_responses = device_name_response  # Dict for all responses
+        device_responses.update(self.sensosys.read_serial_number(_id))  # Serial number
+        device_responses.update(self.sensosys.read_expired_calibration_date(_id))  # Calibration expired data
+        device_responses.update(self.sensosys.read_battery_state(_id))  # Battery state
+
+        # Read special device information
+        if instrument_name.startswith('ANEMO'):
+            device_responses.update(self.sensosys.senso_anemo_read_configuration(_id))
+            device_responses.update(self.sensosys.senso_anemo_read_indicator(_id))
+        elif instrument_name.startswith('THERM'):
+            device_responses.update(self.sensosys.senso_therm_read_configuration(_id))
+            for _ch in range(1, 5):
+                device_responses.update({
+                    f'senso_therm_indicator_channel_{_ch}': self.sensosys.senso_therm_read_indicator(
+                        _id, _ch).get('senso_therm_indicator')
+                })
+        elif instrument_name.startswith(('HYGRO', 'HIGRO')):
+            device_responses.update(self.sensosys.senso_hygbar_read_configuration(_id))
+        else:
+            raise ValueError(f"Invalid instrument name '{instrument_name}'")
+
+        # Convert calibration expired date format from 'dd-mm-yy' or 'dd.mm.yy' to 'yyyy-mm-dd'; a single
+        # regex match replaces the strptime loop over both formats
+        exp_date = device_responses.get('calibration_expired_date')
+        if exp_date is not None:
+            m = _EXP_DATE_RE.match(exp_date)
+            if m is not None:
+                device_responses['calibration_expired_date'] = f'20{m[3]}-{m[2]}-{m[1]}'
+
+        return device_responses
+
     def _get_all_variable_names(self) -> tuple[str, ...]:
         """Get all measurement parameters for instruments that found"""
-        names = ()
+        # Collect into a list: extending is O(1) amortized per name, while '+=' on a tuple copies all previous
+        # names each time
+        names: list[str] = []
+        hygbar_sensor_config = self.sensosys.senso_hygbar_sensor_config
         for _id, _name, _sensor_config in self.sensosys_devices_list:
             if _name.startswith('ANEMO'):
-                names += (f't_a_{_id}', f'v_{_id}', f'vstar_{_id}')
+                names.extend((f't_a_{_id}', f'v_{_id}', f'vstar_{_id}'))
             elif _name.startswith('THERM'):
-                names += (f't_a_{_id}', f't_g_{_id}', f't_w_{_id}', f't_s_{_id}')
+                names.extend((f't_a_{_id}', f't_g_{_id}', f't_w_{_id}', f't_s_{_id}'))
             elif _name.startswith(('HYGRO', 'HIGRO')):
-                names += tuple(f'{p}_{_id}' for p in self.sensosys.senso_hygbar_sensor_config[_sensor_config]['params'])
+                names.extend(f'{p}_{_id}' for p in hygbar_sensor_config[_sensor_config]['params'])
             else:
                 raise ValueError(f"Invalid instrument name '{_name}'")
-        return names
+        # Interned names let dict lookups in the logging hot path succeed on pointer identity
+        return tuple(map(sys.intern, names))
 
-    def read_data(self) -> dict:
-        """Read all measurement data for instruments that found"""
-        data = {}
+    def _build_read_plan(self) -> tuple[tuple[int, str, tuple[str, ...], tuple[str, ...]], ...]:
+        """
+        Build the read plan as (id, name, response keys, variable names) per device
+
+        All per-device decisions of 'read_data' (which response keys, which variable names) are resolved here
+        once; the matching batched requests for 'read_measurement_data_many' are stored in
+        'self._batch_requests' in the same order.
+        """
+        plan = []
+        requests = []
         for _id, _name, _sensor_config in self.sensosys_devices_list:
-            _id = int(_id)  # Convert str id to int
+            id_int = int(_id)  # Convert str id to int
             if _name.startswith('ANEMO'):
-                resp = self.sensosys.senso_anemo_read_measurement_data(_id)
-                if resp is None:
-                    logger.warning(f"No data received from {_id} - {_name} ...")
-                else:
-                    data.update({
-                        f't_a_{_id}': resp.get('t_a'),
-                        f'v_{_id}': resp.get('v'),
-                        f'vstar_{_id}': resp.get('v_star'),
-                    })
+                requests.append((id_int, 'senso_anemo', None))
+                resp_keys = ('t_a', 'v', 'v_star')
+                out_keys = (f't_a_{id_int}', f'v_{id_int}', f'vstar_{id_int}')
             elif _name.startswith('THERM'):
-                resp = self.sensosys.senso_therm_read_temperatures_enabled_channels(_id)
-                if resp is None:
-                    logger.warning(f"No data received from {_id} - {_name} ...")
-                else:
-                    data.update({
-                        f't_a_{_id}': resp.get('t_a'),
-                        f't_g_{_id}': resp.get('t_g'),
-                        f't_w_{_id}': resp.get('t_w'),
-                        f't_s_{_id}': resp.get('t_s'),
-                    })
+                requests.append((id_int, 'senso_therm', None))
+                resp_keys = ('t_a', 't_g', 't_w', 't_s')
+                out_keys = (f't_a_{id_int}', f't_g_{id_int}', f't_w_{id_int}', f't_s_{id_int}')
             elif _name.startswith(('HYGRO', 'HIGRO')):
-                resp = self.sensosys.senso_hygbar_read_measurement_data(_id, _sensor_config)
-                if resp is None:
-                    logger.warning(f"No data received from {_id} - {_name} ...")
-                else:
-                    data.update({
-                        f'{p}_{_id}': resp.get(p)
-                        for p in self.sensosys.senso_hygbar_sensor_config[_sensor_config]['params']
-                    })
+                requests.append((id_int, 'senso_hygbar', _sensor_config))
+                resp_keys = tuple(self.sensosys.senso_hygbar_sensor_config[_sensor_config]['params'])
+                out_keys = tuple(f'{p}_{id_int}' for p in resp_keys)
             else:
                 raise ValueError(f"Invalid instrument name '{_name}'")
+            plan.append((id_int, _name, resp_keys, out_keys))
+        self._batch_requests = tuple(requests)
+        return tuple(plan)
+
+    def read_data(self) -> dict:
+        """Read all measurement data for instruments that found, batched in one pipelined transaction"""
+        data = {}
+        results = self.sensosys.read_measurement_data_many(self._batch_requests)
+        for (id_int, _name, resp_keys, out_keys), resp in zip(self._read_plan, results):
+            if resp is None:
+                logger.warning(f"No data received from {id_int} - {_name} ...")
+            else:
+                data.update(zip(out_keys, (resp.get(k) for k in resp_keys)))
         return data
 
     @staticmethod
@@ -224,7 +308,7 @@ class SensoSysDataSource(DataSource.DataSourceBase):
             sys.exit()
         else:
             logging.info(f"Found available port(s): {available_ports}")
-            return available_ports
+            return frozenset(available_ports)  # Frozen set for O(1) port membership checks
 
     @staticmethod
     def _get_if_pop_system_device_management() -> bool:
@@ -235,8 +319,7 @@ class SensoSysDataSource(DataSource.DataSourceBase):
         elif input_str == 'n':
             return False
         else:
-            logger.error(f"Invalid input '{input_str}', it can only be 'y' or 'n', exiting ...")
-            sys.exit(1)
+            raise ValueError(f"Invalid input '{input_str}', it can only be 'y' or 'n'")
 
     @staticmethod
     def _get_port_name() -> str:
@@ -253,5 +336,4 @@ class SensoSysDataSource(DataSource.DataSourceBase):
         elif input_str == 'n':
             return False
         else:
-            logger.error(f"Invalid input '{input_str}', it can only be 'y' or 'n', exiting ...")
-            sys.exit(1)
+            raise ValueError(f"Invalid input '{input_str}', it can only be 'y' or 'n'")
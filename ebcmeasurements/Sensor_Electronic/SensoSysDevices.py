@@ -31,8 +31,7 @@ import serial  # Pyserial
 import serial.tools.list_ports
 import sys
 import subprocess
-import logging.config
-# Load logging configuration from file
+import logging
 logger = logging.getLogger(__name__)
 
 
@@ -78,6 +77,8 @@ class SensoSys:
         self.port = port
         self.time_out = time_out
         self.ser = None
+        # Cached encoded command batch of 'read_measurement_data_many' as (requests, bytes)
+        self._batch_cmd_cache: tuple[tuple, bytes] | None = None
         # Establish serial connection
         self._establish_serial_connection()
 
@@ -105,6 +106,15 @@ class SensoSys:
         else:
             logger.info(f"Serial connection already established: {self.ser}")
 
+    def set_time_out(self, time_out: float):
+        """
+        Set the serial read timeout in seconds
+        :param time_out: New timeout, applied to an already open connection as well
+        """
+        self.time_out = time_out
+        if self.ser is not None:
+            self.ser.timeout = time_out
+
     def close_serial_connection(self):
         """Close the serial connection"""
         if self.ser and self.ser.is_open:
@@ -703,6 +713,69 @@ class SensoSys:
         _ = self._get_response_by_hex_command(hex_command=command)
         return None
 
+    def read_measurement_data_many(
+            self,
+            requests: tuple[tuple[int, str, str | None], ...]
+    ) -> list[dict[str, float] | None]:
+        """
+        lp22/lp35/lp51 batched: Read measurement data of several devices with one pipelined transaction
+
+        All '#AA0' read commands are written back-to-back in a single serial write; the devices answer in
+        command order on the shared bus, and each response is then framed on its CR terminator and decoded.
+        Compared with one write/read call pair per device, this removes the per-device Python call overhead
+        from the polling loop.
+
+        :param requests: One request per device as (address_id, response_type, sensor_config), with
+            response_type one of 'senso_anemo', 'senso_therm', 'senso_hygbar' and sensor_config only set for
+            SensoHygBar (see 'senso_hygbar_read_measurement_data')
+        :return: List of decoded responses in request order, None per device without valid response
+        """
+        # Build and encode the command batch once per request tuple, replayed on every following poll
+        if self._batch_cmd_cache is None or self._batch_cmd_cache[0] != requests:
+            batch = ''.join(
+                self._to_hex_command('#', self._to_hex(address_id), '0') for address_id, _, _ in requests)
+            self._batch_cmd_cache = (requests, batch.encode('utf-8'))
+        # Send all commands in one write
+        try:
+            self.ser.write(self._batch_cmd_cache[1])
+        except serial.SerialTimeoutException as e:
+            logger.error(e)
+            return [None] * len(requests)
+        # Drain one CR-framed response per request and decode it by its device type
+        results = []
+        for address_id, response_type, sensor_config in requests:
+            try:
+                response = self.ser.read_until(expected=b'\r').decode('utf-8').strip()
+            except UnicodeError as e:
+                logger.error(e)
+                results.append(None)
+                continue
+            if response_type == 'senso_anemo':
+                results.append(self._decode_response(
+                    response=response,
+                    parse={'senso_anemo_measurement_data': (1, 21)},
+                    response_type='senso_anemo',
+                ))
+            elif response_type == 'senso_therm':
+                results.append(self._decode_response(
+                    response=response,
+                    parse={'senso_therm_temperatures': (1, 28)},
+                    response_type='senso_therm',
+                ))
+            elif response_type == 'senso_hygbar':
+                results.append(self._decode_response(
+                    response=response,
+                    parse={
+                        'senso_hygbar_measurement_data':
+                            self._senso_hygbar_sensor_config[sensor_config]['data_start_stop_index'],
+                    },
+                    response_type='senso_hygbar',
+                    sensor_config=sensor_config,
+                ))
+            else:
+                raise ValueError(f"Invalid response type '{response_type}'")
+        return results
+
     def senso_anemo_read_measurement_data(self, address_id: int) -> dict[str, float] | None:
         """
         lp51: SensoAnemo - Read a measurement data
@@ -1,20 +1,42 @@
 from .Base import Auxiliary, DataLogger, DataOutput, DataSource
-from .Icpdas import IcpdasDataSourceOutput
-from .Mqtt import MqttDataSourceOutput, MqttTheThingsNetwork
-from .Sensor_Electronic import SensoSysDataSource
+import importlib
 import logging
 
-try:
-    from .Beckhoff import AdsDataSourceOutput
-except FileNotFoundError as e:
-    # Without TwinCAT installed in system, 'FileNotFoundError' will be raised by Pyads due to missing 'TcAdsDll.dll'.
-    # Ref1: https://github.com/stlehmann/pyads/issues/105
-    # Ref2: https://stackoverflow.com/questions/76305160/windows-10-python-pyads-library-error-could-not-find-module-tcadsdll-dll
-    logging.warning(
-        f"Without TwinCAT installed on the system, 'AdsDataSourceOutput' submodule will not be available. "
-        f"Original error: {e}")
-except ImportError as e:
-    logging.error(f"Failed to import 'AdsDataSourceOutput': {e}")
+# Lazy submodule loading (PEP 562): the device interfaces drag in their protocol stacks (paho-mqtt, pyads,
+# pyserial) at import time, so they are only imported on first attribute access instead of on every
+# 'import ebcmeasurements'
+_LAZY_SUBMODULES = {
+    'AdsDataSourceOutput': '.Beckhoff',
+    'IcpdasDataSourceOutput': '.Icpdas',
+    'MqttDataSourceOutput': '.Mqtt',
+    'MqttTheThingsNetwork': '.Mqtt',
+    'SensoSysDataSource': '.Sensor_Electronic',
+}
+
+
+def __getattr__(name: str):
+    """Resolve lazy submodules on first access and cache them in the module globals"""
+    sub_package = _LAZY_SUBMODULES.get(name)
+    if sub_package is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    try:
+        module = importlib.import_module(f'{sub_package}.{name}', __name__)
+    except FileNotFoundError as e:
+        # Without TwinCAT installed in system, 'FileNotFoundError' will be raised by Pyads due to missing
+        # 'TcAdsDll.dll'.
+        # Ref1: https://github.com/stlehmann/pyads/issues/105
+        # Ref2: https://stackoverflow.com/questions/76305160/windows-10-python-pyads-library-error-could-not-find-module-tcadsdll-dll
+        logging.warning(
+            f"Without TwinCAT installed on the system, '{name}' submodule will not be available. "
+            f"Original error: {e}")
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from e
+    globals()[name] = module  # Cache, so later accesses skip this hook
+    return module
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_SUBMODULES))
+
 
 # Configure the root logger with a default leve and format
 logging.basicConfig(
@@ -31,16 +53,12 @@ def set_logging_level(level: str):
     level = level.upper()
     try:
         numeric_level = getattr(logging, level)
-        # Set the logging level for the root logger and all child loggers
+        # Set the logging level for the root logger and all loggers of this package; sweeping the logger
+        # registry keeps newly added submodules covered without maintaining a hardcoded name list
         logging.getLogger().setLevel(numeric_level)
-        for logger_name in [
-            'ebcmeasurements.Base',
-            'ebcmeasurements.Beckhoff',
-            'ebcmeasurements.Icpdas',
-            'ebcmeasurements.Mqtt',
-            'ebcmeasurements.Sensor_Electronic',
-        ]:
-            logging.getLogger(logger_name).setLevel(numeric_level)
+        for logger_name, _logger in logging.Logger.manager.loggerDict.items():
+            if logger_name.startswith('ebcmeasurements') and isinstance(_logger, logging.Logger):
+                _logger.setLevel(numeric_level)
         print(f"Logging level set to {level} for all modules.")
     except AttributeError:
         print(f"Invalid logging level: {level}. Use DEBUG, INFO, WARNING, ERROR, or CRITICAL.")
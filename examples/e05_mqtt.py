@@ -71,23 +71,18 @@ def e05_mqtt():
         }
     )
 
-    # Now, use threading to run multiple instances. The on-message logger does not require a separate thread,
-    # as it operates in the main thread without method.
-    import threading
-    thread_publish = threading.Thread(
-        target=logger_publish.run_data_logging,
-        args=(2, 30),
-        name='Thread publish',
-    )
-    thread_periodic = threading.Thread(
-        target=logger_periodic.run_data_logging,
-        args=(1, 30),
-        name='Thread subscribe periodic',
-    )
-    thread_publish.start()
-    thread_periodic.start()
-    thread_publish.join()
-    thread_periodic.join()
+    # Now, use asyncio to run multiple instances concurrently on a single event loop, which avoids thread wakeup
+    # and GIL handoff latency per tick. The on-message logger does not require a separate coroutine, as it is
+    # driven by the MQTT network thread.
+    import asyncio
+
+    async def publish_and_subscribe():
+        await asyncio.gather(
+            logger_publish.run_data_logging_async(interval=2, duration=30),
+            logger_periodic.run_data_logging_async(interval=1, duration=30),
+        )
+
+    asyncio.run(publish_and_subscribe())
 
     # Compare both csv files: In the file with periodic-trigger, data was logged every second as configured. An empty
     # row was logged if the values were already recorded (so that the buffer was cleared) or if no values were